@@ -7,10 +7,12 @@ Restricts admin access to superusers only.
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext_lazy as _, ngettext
 from django.contrib.admin import AdminSite
+from django.db.models import Count
 
 from .models import CustomUser, Publisher, Article, Newsletter
+from .signals import queue_bulk_post_approval_actions
 
 
 class RestrictedAdminSite(AdminSite):
@@ -64,7 +66,10 @@ class CustomUserAdmin(UserAdmin):
         }),
     )
     
-    filter_horizontal = ('groups', 'user_permissions', 'subscribed_publishers', 'subscribed_journalists')
+    filter_horizontal = ('groups', 'user_permissions')
+    
+    # Subscriptions can grow without bound, so avoid rendering every option
+    raw_id_fields = ('subscribed_publishers', 'subscribed_journalists')
 
 
 @admin.register(Publisher)
@@ -74,9 +79,10 @@ class PublisherAdmin(admin.ModelAdmin):
     """
     
     list_display = ['name', 'website', 'created_at', 'get_article_count']
+    ordering = ['name']
     list_filter = ['created_at']
     search_fields = ['name', 'description']
-    filter_horizontal = ['editors', 'journalists']
+    autocomplete_fields = ['editors', 'journalists']
     
     fieldsets = (
         (None, {
@@ -90,10 +96,17 @@ class PublisherAdmin(admin.ModelAdmin):
     
     readonly_fields = ['created_at', 'updated_at']
     
+    def get_queryset(self, request):
+        """Annotate article counts so the changelist needs a single query."""
+        return super().get_queryset(request).annotate(
+            _article_count=Count('articles')
+        )
+    
     def get_article_count(self, obj):
         """Get the number of articles for this publisher."""
-        return obj.articles.count()
+        return obj._article_count
     get_article_count.short_description = 'Article Count'
+    get_article_count.admin_order_field = '_article_count'
 
 
 @admin.register(Article)
@@ -103,9 +116,13 @@ class ArticleAdmin(admin.ModelAdmin):
     """
     
     list_display = ['title', 'get_source', 'approved', 'approved_by', 'created_at']
+    ordering = ['-created_at']
     list_filter = ['approved', 'created_at', 'updated_at']
     search_fields = ['title', 'content', 'author__username', 'publisher__name']
     readonly_fields = ['created_at', 'updated_at', 'approved_at']
+    list_select_related = ['author', 'publisher', 'approved_by']
+    autocomplete_fields = ['author', 'publisher', 'approved_by']
+    actions = ['approve_selected']
     
     fieldsets = (
         (None, {
@@ -127,6 +144,22 @@ class ArticleAdmin(admin.ModelAdmin):
         """Get the source of the article."""
         return obj.get_source()
     get_source.short_description = 'Source'
+    
+    def approve_selected(self, request, queryset):
+        """
+        Approve the selected articles with a single UPDATE.
+        
+        Notifications go out as one batched email task and one batched
+        Twitter/X task instead of one of each per article.
+        """
+        article_ids = queryset.approve(request.user)
+        queue_bulk_post_approval_actions(article_ids)
+        self.message_user(request, ngettext(
+            '%d article was approved.',
+            '%d articles were approved.',
+            len(article_ids),
+        ) % len(article_ids))
+    approve_selected.short_description = _('Approve selected articles')
 
 
 @admin.register(Newsletter)
@@ -136,9 +169,11 @@ class NewsletterAdmin(admin.ModelAdmin):
     """
     
     list_display = ['title', 'author', 'get_article_count', 'created_at']
+    ordering = ['-created_at']
     list_filter = ['created_at', 'author']
     search_fields = ['title', 'description', 'author__username']
-    filter_horizontal = ['articles']
+    list_select_related = ['author']
+    autocomplete_fields = ['author', 'articles']
     readonly_fields = ['created_at', 'updated_at']
     
     fieldsets = (
@@ -153,8 +188,15 @@ class NewsletterAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate article counts so the changelist needs a single query."""
+        return super().get_queryset(request).annotate(
+            _article_count=Count('articles')
+        )
+    
     def get_article_count(self, obj):
         """Get the number of articles in this newsletter."""
-        return obj.get_article_count()
+        return obj._article_count
     get_article_count.short_description = 'Article Count'
+    get_article_count.admin_order_field = '_article_count'
 
@@ -9,10 +9,25 @@ from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q
-from django.utils import timezone
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.db.models import Count, Prefetch, Q
+import logging
 
-from .models import Article, Newsletter, Publisher, CustomUser
+from .models import (
+    Article,
+    Newsletter,
+    Publisher,
+    CustomUser,
+    USER_DETAIL_CACHE_TIMEOUT,
+    user_detail_cache_key
+)
+from .pagination import (
+    EstimatedCountPagination,
+    IdCursorPagination,
+    NameCursorPagination
+)
+from .signals import queue_post_approval_actions
 from .serializers import (
     ArticleListSerializer,
     ArticleDetailSerializer,
@@ -32,6 +47,8 @@ from .permissions import (
     IsJournalist
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ArticleViewSet(viewsets.ModelViewSet):
     """
@@ -49,63 +66,68 @@ class ArticleViewSet(viewsets.ModelViewSet):
     
     queryset = Article.objects.all()
     permission_classes = [IsAuthenticated]
+    pagination_class = EstimatedCountPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'content', 'author__username', 'publisher__name']
     ordering_fields = ['created_at', 'updated_at', 'title']
     ordering = ['-created_at']
     
+    # Serializer per action; anything else uses ArticleListSerializer
+    serializer_classes = {
+        'create': ArticleCreateSerializer,
+        'retrieve': ArticleDetailSerializer,
+        'update': ArticleDetailSerializer,
+        'partial_update': ArticleDetailSerializer,
+    }
+    
     def get_serializer_class(self):
         """
         Return appropriate serializer based on action.
         """
-        if self.action == 'create':
-            return ArticleCreateSerializer
-        elif self.action in ['retrieve', 'update', 'partial_update']:
-            return ArticleDetailSerializer
-        return ArticleListSerializer
+        return self.serializer_classes.get(self.action, ArticleListSerializer)
     
     def get_queryset(self):
         """
         Filter queryset based on user role and permissions.
         
         - Readers: Only approved articles
-        - Editors: All articles
+        - Editors and superusers: All articles
         - Journalists: Their own articles + all approved articles
         """
         user = self.request.user
-        queryset = Article.objects.all()
+        # Join the FKs the serializers read so each page costs a single query
+        queryset = Article.objects.viewable_by(user).select_related(
+            'author', 'publisher', 'approved_by'
+        )
         
-        if user.role == CustomUser.READER:
-            # Readers only see approved articles
-            queryset = queryset.filter(approved=True)
-        elif user.role == CustomUser.JOURNALIST:
-            # Journalists see their own articles + approved articles
-            queryset = queryset.filter(
-                Q(approved=True) | Q(author=user)
-            )
-        # Editors see all articles (no filtering)
+        # The list serializer never renders the article body
+        if self.action == 'list':
+            queryset = queryset.defer('content')
         
         return queryset.order_by('-created_at')
     
+    # Permission classes hold no state, so each instance is built once.
+    # Only journalists can create; editors and journalists can modify;
+    # viewing a single article and approval have their own checks.
+    _modify_permissions = (IsAuthenticated(), CanModifyArticle())
+    permissions_by_action = {
+        'create': (IsAuthenticated(), IsJournalist()),
+        'update': _modify_permissions,
+        'partial_update': _modify_permissions,
+        'destroy': _modify_permissions,
+        'retrieve': (IsAuthenticated(), CanViewArticle()),
+        'approve': (IsAuthenticated(), CanApproveArticle()),
+    }
+    # Default: authenticated users can list
+    default_permissions = (IsAuthenticated(),)
+    
     def get_permissions(self):
         """
         Set permissions based on action.
         """
-        if self.action == 'create':
-            # Only journalists can create
-            return [IsAuthenticated(), IsJournalist()]
-        elif self.action in ['update', 'partial_update', 'destroy']:
-            # Editors and journalists can modify
-            return [IsAuthenticated(), CanModifyArticle()]
-        elif self.action == 'retrieve':
-            # Custom permission for viewing
-            return [IsAuthenticated(), CanViewArticle()]
-        elif self.action == 'approve':
-            # Only editors can approve
-            return [IsAuthenticated(), CanApproveArticle()]
-        
-        # Default: authenticated users can list
-        return [IsAuthenticated()]
+        return list(
+            self.permissions_by_action.get(self.action, self.default_permissions)
+        )
     
     def perform_create(self, serializer):
         """
@@ -143,16 +165,23 @@ class ArticleViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get subscribed publishers and journalists
-        subscribed_publishers = user.subscribed_publishers.all()
-        subscribed_journalists = user.subscribed_journalists.all()
+        # Get subscribed publisher and journalist IDs
+        subscription_ids = user.get_subscription_ids()
+        publisher_ids = subscription_ids['publishers']
+        journalist_ids = subscription_ids['journalists']
         
-        # Filter approved articles from subscribed sources
-        articles = Article.objects.filter(
+        # Filter approved articles from subscribed sources. Both conditions
+        # are on the article's own columns, so nothing is joined and no
+        # row can match twice; don't add .distinct() here.
+        articles = Article.objects.select_related(
+            'author', 'publisher', 'approved_by'
+        ).defer(
+            'content'
+        ).filter(
             approved=True
         ).filter(
-            Q(publisher__in=subscribed_publishers) |
-            Q(author__in=subscribed_journalists)
+            Q(publisher_id__in=publisher_ids) |
+            Q(author_id__in=journalist_ids)
         ).order_by('-created_at')
         
         # Paginate results
@@ -171,35 +200,45 @@ class ArticleViewSet(viewsets.ModelViewSet):
         
         POST /api/articles/<id>/approve/
         
-        This triggers the signals that send emails and post to Twitter/X.
+        This queues the task that sends emails and posts to Twitter/X.
         """
+        # get_object() turns a missing or malformed pk into a 404 and runs
+        # the object permission checks
         article = self.get_object()
         
-        # Check if already approved
-        if article.approved:
+        # approve() locks the row, so two editors can't both approve (and
+        # notify) it, and drops the cached pending count
+        try:
+            approved_ids = Article.objects.filter(pk=article.pk).approve(request.user)
+        except DatabaseError:
+            # Log the details but don't expose database errors to the client
+            logger.exception(f"Database error approving article {article.pk}")
             return Response(
-                {'detail': 'Article is already approved.'},
-                status=status.HTTP_400_BAD_REQUEST
+                {'detail': 'Error approving article.'},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         
-        try:
-            # Approve the article
-            article.approved = True
-            article.approved_by = request.user
-            article.approved_at = timezone.now()
-            article.save()  # This triggers the post_save signal
-            
-            serializer = ArticleDetailSerializer(article, context={'request': request})
-            return Response({
-                'detail': 'Article approved successfully. Notifications sent to subscribers.',
-                'article': serializer.data
-            }, status=status.HTTP_200_OK)
-            
-        except Exception as e:
+        if not approved_ids:
             return Response(
-                {'detail': f'Error approving article: {str(e)}'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {'detail': 'Article is already approved.'},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        
+        article.refresh_from_db(fields=['approved', 'approved_at', 'updated_at'])
+        article.approved_by = request.user
+        
+        # approve() skips the post_save signals, so queue notifications here
+        logger.info(
+            f"Article '{article.title}' was approved. "
+            "Triggering post-approval actions..."
+        )
+        queue_post_approval_actions(article.pk)
+        
+        serializer = ArticleDetailSerializer(article, context={'request': request})
+        return Response({
+            'detail': 'Article approved successfully. Subscribers will be notified shortly.',
+            'article': serializer.data
+        }, status=status.HTTP_200_OK)
 
 
 class NewsletterViewSet(viewsets.ModelViewSet):
@@ -221,23 +260,52 @@ class NewsletterViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'updated_at', 'title']
     ordering = ['-created_at']
     
+    # Serializer per action; anything else uses NewsletterSerializer
+    serializer_classes = {
+        'create': NewsletterCreateSerializer,
+    }
+    
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
-        if self.action == 'create':
-            return NewsletterCreateSerializer
-        return NewsletterSerializer
+        return self.serializer_classes.get(self.action, NewsletterSerializer)
+    
+    def get_queryset(self):
+        """
+        Load what NewsletterSerializer renders up front for reads.
+        
+        Writes keep the plain queryset, so the response after an update
+        isn't built from stale counts.
+        """
+        queryset = Newsletter.objects.all()
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.with_counts().select_related(
+                'author'
+            ).prefetch_related(
+                Prefetch(
+                    'articles',
+                    queryset=Article.objects.select_related(
+                        'author', 'publisher', 'approved_by'
+                    ).order_by('-created_at')
+                )
+            )
+        return queryset
+    
+    # Only journalists can create; editors and journalists can modify
+    _modify_permissions = (IsAuthenticated(), IsEditorOrJournalist())
+    permissions_by_action = {
+        'create': (IsAuthenticated(), IsJournalist()),
+        'update': _modify_permissions,
+        'partial_update': _modify_permissions,
+        'destroy': _modify_permissions,
+    }
+    # Anyone authenticated can list/retrieve
+    default_permissions = (IsAuthenticated(),)
     
     def get_permissions(self):
         """Set permissions based on action."""
-        if self.action == 'create':
-            # Only journalists can create
-            return [IsAuthenticated(), IsJournalist()]
-        elif self.action in ['update', 'partial_update', 'destroy']:
-            # Editors and journalists can modify
-            return [IsAuthenticated(), IsEditorOrJournalist()]
-        
-        # Anyone authenticated can list/retrieve
-        return [IsAuthenticated()]
+        return list(
+            self.permissions_by_action.get(self.action, self.default_permissions)
+        )
     
     def perform_create(self, serializer):
         """
@@ -268,10 +336,19 @@ class PublisherViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Publisher.objects.all()
     serializer_class = PublisherSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NameCursorPagination
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
+    
+    def get_queryset(self):
+        """Count approved articles in the same query as the publishers."""
+        return Publisher.objects.annotate(
+            approved_article_count=Count(
+                'articles', filter=Q(articles__approved=True)
+            )
+        )
 
 
 class UserViewSet(viewsets.ReadOnlyModelViewSet):
@@ -287,6 +364,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = CustomUser.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = IdCursorPagination
     filter_backends = [filters.SearchFilter]
     search_fields = ['username', 'email', 'first_name', 'last_name']
     
@@ -296,6 +374,15 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
         Get current user details.
         
         GET /api/users/me/
+        
+        The serialized user is cached per user in the shared cache (see
+        CACHES) and dropped whenever the user is saved, so no worker keeps
+        serving the old details.
         """
-        serializer = UserSerializer(request.user, context={'request': request})
-        return Response(serializer.data)
+        cache_key = user_detail_cache_key(request.user.pk)
+        data = cache.get(cache_key)
+        if data is None:
+            serializer = UserSerializer(request.user, context={'request': request})
+            data = serializer.data
+            cache.set(cache_key, data, USER_DETAIL_CACHE_TIMEOUT)
+        return Response(data)
@@ -0,0 +1,405 @@
+"""
+Management command to create sample data for testing.
+
+This command creates sample users, publishers, articles, and newsletters.
+It can also generate any number of extra readers and articles to build
+large datasets for performance testing.
+
+Rows are built in Python and inserted with bulk_create inside a single
+transaction. Existing sample rows are left untouched, so the command can
+be re-run safely; generated articles are added on every run.
+
+Usage:
+    python manage.py seed_sample_data
+    python manage.py seed_sample_data --readers 1000 --articles 100000
+"""
+
+from argparse import ArgumentTypeError
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from news.models import Publisher, Article, Newsletter
+
+User = get_user_model()
+
+SAMPLE_PASSWORD = 'password123'
+
+# Prefixes for generated rows, kept apart from the fixed sample data
+GENERATED_READER_PREFIX = 'sample_reader_'
+GENERATED_ARTICLE_PREFIX = 'Sample Article '
+
+
+def positive_int(value):
+    """Parse an option value that must be a whole number of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f'must be at least 1, got {number}')
+    return number
+
+
+class Command(BaseCommand):
+    """
+    Django management command to seed the database with sample data.
+    """
+
+    help = (
+        'Creates sample users, publishers, articles, and newsletters, '
+        'optionally with extra generated readers and articles'
+    )
+
+    def add_arguments(self, parser):
+        """Add options for generated data and insert batch size."""
+        parser.add_argument(
+            '--readers',
+            type=int,
+            default=0,
+            help='Number of extra readers to generate'
+        )
+        parser.add_argument(
+            '--articles',
+            type=int,
+            default=0,
+            help='Number of extra articles to generate'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=positive_int,
+            default=1000,
+            help='Number of rows per INSERT statement'
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        """
+        Main method that executes when the command is run.
+        Creates all sample data in a single transaction.
+        """
+        self.batch_size = options['batch_size']
+        # Hash the shared password once instead of once per user
+        self.password_hash = make_password(SAMPLE_PASSWORD)
+
+        self.stdout.write(self.style.SUCCESS('Creating sample data...'))
+
+        # ===== USERS =====
+        self.stdout.write('\nCreating users...')
+        user_specs = [
+            ('reader1', 'reader1@example.com', User.READER, 'Alice', 'Reader'),
+            ('journalist1', 'journalist1@example.com', User.JOURNALIST, 'Bob', 'Writer'),
+            ('journalist2', 'journalist2@example.com', User.JOURNALIST, 'Carol', 'Scribe'),
+            ('editor1', 'editor1@example.com', User.EDITOR, 'David', 'Editor'),
+        ]
+        users = self._create_users([
+            User(
+                username=username,
+                email=email,
+                role=role,
+                first_name=first_name,
+                last_name=last_name,
+            )
+            for username, email, role, first_name, last_name in user_specs
+        ])
+        reader1 = users['reader1']
+        journalist1 = users['journalist1']
+        journalist2 = users['journalist2']
+        editor1 = users['editor1']
+        for username, _, role, _, _ in user_specs:
+            self.stdout.write(f'  ✓ Created {role}: {username}')
+
+        # ===== PUBLISHERS =====
+        self.stdout.write('\nCreating publishers...')
+        publisher_specs = [
+            ('Tech News Daily', 'Your source for technology news',
+             'https://technewsdaily.example.com'),
+            ('World Report', 'Global news coverage',
+             'https://worldreport.example.com'),
+        ]
+        publisher_names = [spec[0] for spec in publisher_specs]
+        Publisher.objects.bulk_create(
+            [
+                Publisher(name=name, description=description, website=website)
+                for name, description, website in publisher_specs
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        publishers = Publisher.objects.in_bulk(publisher_names, field_name='name')
+        publisher1 = publishers['Tech News Daily']
+        publisher2 = publishers['World Report']
+
+        PublisherJournalist = Publisher.journalists.through
+        PublisherJournalist.objects.bulk_create(
+            [
+                PublisherJournalist(publisher_id=publisher1.id, customuser_id=journalist1.id),
+                PublisherJournalist(publisher_id=publisher2.id, customuser_id=journalist2.id),
+            ],
+            ignore_conflicts=True,
+        )
+        for name in publisher_names:
+            self.stdout.write(f'  ✓ Created publisher: {name}')
+
+        # Subscribe reader to journalist and publisher
+        self._subscribe([reader1.id], journalist1, publisher1)
+        self.stdout.write(
+            f'  ✓ Subscribed {reader1.username} to '
+            f'{journalist1.username} and {publisher1.name}'
+        )
+
+        # ===== ARTICLES =====
+        self.stdout.write('\nCreating articles...')
+        # bulk_create skips the pre_save signal that stamps approvals
+        approved_at = timezone.now()
+        article_specs = [
+            # Independent journalist article (approved)
+            {
+                'title': 'AI Breakthrough in Machine Learning',
+                'content': '''Researchers have announced a major breakthrough in machine learning
+        algorithms that could revolutionize the field. The new approach demonstrates
+        unprecedented accuracy in pattern recognition tasks...''',
+                'author': journalist1,
+                'approved': True,
+                'approved_by': editor1,
+                'approved_at': approved_at,
+            },
+            # Pending journalist article
+            {
+                'title': 'Future of Quantum Computing',
+                'content': '''Quantum computing is poised to transform computational science.
+        Recent developments suggest we may see practical applications sooner than expected...''',
+                'author': journalist1,
+                'approved': False,
+            },
+            # Publisher article (approved)
+            {
+                'title': 'Global Markets Rally on Economic News',
+                'content': '''Stock markets around the world saw significant gains today following
+        positive economic indicators. Analysts are optimistic about the outlook...''',
+                'publisher': publisher2,
+                'approved': True,
+                'approved_by': editor1,
+                'approved_at': approved_at,
+            },
+            # Another independent article
+            {
+                'title': 'Climate Change: New Study Reveals Trends',
+                'content': '''A comprehensive new study on climate change has revealed worrying
+        trends in global temperature rise. Scientists are calling for immediate action...''',
+                'author': journalist2,
+                'approved': True,
+                'approved_by': editor1,
+                'approved_at': approved_at,
+            },
+        ]
+        articles = self._create_missing_by_title(Article, article_specs)
+        article1 = articles['AI Breakthrough in Machine Learning']
+        article3 = articles['Global Markets Rally on Economic News']
+        article4 = articles['Climate Change: New Study Reveals Trends']
+        for spec in article_specs:
+            label = 'article' if spec['approved'] else 'pending article'
+            self.stdout.write(f"  ✓ Created {label}: {spec['title']}")
+
+        # ===== NEWSLETTERS =====
+        self.stdout.write('\nCreating newsletters...')
+        newsletter_specs = [
+            {
+                'title': 'Weekly Tech Roundup',
+                'description': 'The most important technology news of the week',
+                'author': journalist1,
+            },
+            {
+                'title': 'Science & Environment Digest',
+                'description': 'Latest developments in science and environmental news',
+                'author': journalist2,
+            },
+        ]
+        newsletters = self._create_missing_by_title(Newsletter, newsletter_specs)
+        newsletter1 = newsletters['Weekly Tech Roundup']
+        newsletter2 = newsletters['Science & Environment Digest']
+
+        NewsletterArticle = Newsletter.articles.through
+        NewsletterArticle.objects.bulk_create(
+            [
+                NewsletterArticle(newsletter_id=newsletter1.id, article_id=article1.id),
+                NewsletterArticle(newsletter_id=newsletter1.id, article_id=article3.id),
+                NewsletterArticle(newsletter_id=newsletter2.id, article_id=article4.id),
+            ],
+            ignore_conflicts=True,
+        )
+        for spec in newsletter_specs:
+            self.stdout.write(f"  ✓ Created newsletter: {spec['title']}")
+
+        # ===== GENERATED DATA =====
+        if options['readers']:
+            self._generate_readers(options['readers'], journalist1, publisher1)
+        if options['articles']:
+            self._generate_articles(
+                options['articles'], [journalist1, journalist2], publisher2, editor1
+            )
+
+        # Success message
+        self.stdout.write(self.style.SUCCESS(
+            '\n✓ Sample data created successfully!'
+        ))
+        self.stdout.write(
+            f'\nLogin credentials (password for all: {SAMPLE_PASSWORD}):'
+        )
+        self.stdout.write(f'  Reader:     {reader1.username}')
+        self.stdout.write(f'  Journalist: {journalist1.username}')
+        self.stdout.write(f'  Journalist: {journalist2.username}')
+        self.stdout.write(f'  Editor:     {editor1.username}')
+
+    def _create_users(self, users):
+        """
+        Insert users that don't exist yet and reset every password.
+
+        bulk_create bypasses CustomUser.save(), so role groups are
+        assigned here as well.
+
+        Args:
+            users: Unsaved CustomUser instances
+
+        Returns:
+            Dict mapping username to the saved CustomUser
+        """
+        usernames = [user.username for user in users]
+        for user in users:
+            user.password = self.password_hash
+
+        User.objects.bulk_create(
+            users, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        # Reset passwords on pre-existing users with a single UPDATE
+        User.objects.filter(username__in=usernames).update(
+            password=self.password_hash
+        )
+        saved = User.objects.in_bulk(usernames, field_name='username')
+
+        groups = Group.objects.in_bulk(
+            list(User.ROLE_GROUP_NAMES.values()), field_name='name'
+        )
+        UserGroup = User.groups.through
+        UserGroup.objects.bulk_create(
+            [
+                UserGroup(
+                    customuser_id=user.id,
+                    group_id=groups[User.ROLE_GROUP_NAMES[user.role]].id
+                )
+                for user in saved.values()
+                if User.ROLE_GROUP_NAMES[user.role] in groups
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        return saved
+
+    def _create_missing_by_title(self, model, specs):
+        """
+        Insert rows whose title doesn't exist yet.
+
+        Titles are not unique, so existing ones are looked up first
+        instead of relying on ignore_conflicts.
+
+        Args:
+            model: Article or Newsletter
+            specs: List of field dicts, each with a 'title'
+
+        Returns:
+            Dict mapping title to the saved instance
+        """
+        titles = [spec['title'] for spec in specs]
+        existing_titles = set(
+            model.objects.filter(title__in=titles).values_list('title', flat=True)
+        )
+        instances = [
+            model(**spec) for spec in specs if spec['title'] not in existing_titles
+        ]
+        if model is Article:
+            for article in instances:
+                article.refresh_source_display()
+        model.objects.bulk_create(instances, batch_size=self.batch_size)
+        return {
+            instance.title: instance
+            for instance in model.objects.filter(title__in=titles)
+        }
+
+    def _subscribe(self, reader_ids, journalist, publisher):
+        """Subscribe readers to a journalist and a publisher."""
+        SubscribedJournalist = User.subscribed_journalists.through
+        SubscribedJournalist.objects.bulk_create(
+            [
+                SubscribedJournalist(
+                    from_customuser_id=reader_id, to_customuser_id=journalist.id
+                )
+                for reader_id in reader_ids
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        SubscribedPublisher = User.subscribed_publishers.through
+        SubscribedPublisher.objects.bulk_create(
+            [
+                SubscribedPublisher(customuser_id=reader_id, publisher_id=publisher.id)
+                for reader_id in reader_ids
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+    def _generate_readers(self, count, journalist, publisher):
+        """
+        Generate readers subscribed to a journalist and a publisher.
+
+        Existing generated readers with the same usernames are reused.
+        """
+        self.stdout.write(f'\nGenerating {count} readers...')
+        readers = self._create_users([
+            User(
+                username=f'{GENERATED_READER_PREFIX}{i}',
+                email=f'{GENERATED_READER_PREFIX}{i}@example.com',
+                role=User.READER,
+            )
+            for i in range(1, count + 1)
+        ])
+        self._subscribe(
+            [reader.id for reader in readers.values()], journalist, publisher
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✓ Generated {count} readers subscribed to '
+            f'{journalist.username} and {publisher.name}'
+        ))
+
+    def _generate_articles(self, count, journalists, publisher, editor):
+        """
+        Generate articles alternating between journalists and a publisher.
+
+        Every other article is approved by the editor.
+        """
+        self.stdout.write(f'\nGenerating {count} articles...')
+        sources = [{'author': journalist} for journalist in journalists]
+        sources.append({'publisher': publisher})
+
+        # bulk_create skips the pre_save signal that stamps approvals
+        approved_at = timezone.now()
+        # Build and insert one batch at a time, so a large --articles
+        # count never holds every instance in memory
+        for start in range(1, count + 1, self.batch_size):
+            articles = []
+            for i in range(start, min(start + self.batch_size, count + 1)):
+                approved = i % 2 == 0
+                article = Article(
+                    title=f'{GENERATED_ARTICLE_PREFIX}{i}',
+                    content=f'Generated content for sample article {i}.',
+                    approved=approved,
+                    approved_by=editor if approved else None,
+                    approved_at=approved_at if approved else None,
+                    **sources[i % len(sources)]
+                )
+                article.refresh_source_display()
+                articles.append(article)
+            Article.objects.bulk_create(articles)
+        self.stdout.write(self.style.SUCCESS(
+            f'  ✓ Generated {count} articles'
+        ))
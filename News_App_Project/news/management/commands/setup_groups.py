@@ -11,7 +11,19 @@ Usage:
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
-from news.models import Article, Newsletter, Publisher
+from django.db import transaction
+from news.models import Article, CustomUser, Newsletter, Publisher
+
+
+# Reader, Editor, Journalist
+GROUP_NAMES = list(CustomUser.ROLE_GROUP_NAMES.values())
+
+# Every permission codename assigned to any group below
+PERMISSION_CODENAMES = [
+    f'{action}_{model}'
+    for action in ('add', 'view', 'change', 'delete')
+    for model in ('article', 'newsletter', 'publisher')
+]
 
 
 class Command(BaseCommand):
@@ -24,66 +36,62 @@ class Command(BaseCommand):
         'with appropriate permissions'
     )
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         """
         Main method that executes when the command is run.
-        Creates groups and assigns permissions based on role requirements.
+        Creates groups and assigns permissions based on role requirements
+        in a single transaction.
         """
         self.stdout.write(
             self.style.SUCCESS('Setting up user groups and permissions...')
         )
         
         try:
-            # Create groups
-            reader_group, created = Group.objects.get_or_create(name='Reader')
-            if created:
-                self.stdout.write(self.style.SUCCESS('Created Reader group'))
-            else:
-                self.stdout.write('Reader group already exists')
-            
-            editor_group, created = Group.objects.get_or_create(name='Editor')
-            if created:
-                self.stdout.write(self.style.SUCCESS('Created Editor group'))
-            else:
-                self.stdout.write('Editor group already exists')
-            
-            journalist_group, created = Group.objects.get_or_create(
-                name='Journalist'
+            # Create groups (one SELECT, plus an INSERT per missing group).
+            # Existing groups are locked so concurrent runs don't interleave.
+            groups = Group.objects.select_for_update().in_bulk(
+                GROUP_NAMES, field_name='name'
             )
-            if created:
-                self.stdout.write(
-                    self.style.SUCCESS('Created Journalist group')
-                )
-            else:
-                self.stdout.write('Journalist group already exists')
+            for name in GROUP_NAMES:
+                if name in groups:
+                    self.stdout.write(f'{name} group already exists')
+                else:
+                    groups[name] = Group.objects.create(name=name)
+                    self.stdout.write(
+                        self.style.SUCCESS(f'Created {name} group')
+                    )
+            reader_group = groups['Reader']
+            editor_group = groups['Editor']
+            journalist_group = groups['Journalist']
             
-            # Get content types for our models
-            article_ct = ContentType.objects.get_for_model(Article)
-            newsletter_ct = ContentType.objects.get_for_model(Newsletter)
-            publisher_ct = ContentType.objects.get_for_model(Publisher)
+            # Get content types for our models in a single query
+            content_types = ContentType.objects.get_for_models(
+                Article, Newsletter, Publisher
+            )
             
-            # Clear existing permissions from all groups
-            reader_group.permissions.clear()
-            editor_group.permissions.clear()
-            journalist_group.permissions.clear()
+            # Fetch every permission we assign in a single query. Codenames
+            # include the model name, so they are unique across these
+            # content types; the content type filter only guards against
+            # codename collisions from other apps.
+            perm_map = {
+                perm.codename: perm
+                for perm in Permission.objects.filter(
+                    content_type_id__in=[ct.id for ct in content_types.values()],
+                    codename__in=PERMISSION_CODENAMES,
+                )
+            }
             
             # ===== READER PERMISSIONS =====
             # Readers can only VIEW articles and newsletters
             self.stdout.write('\nSetting up Reader permissions...')
             
             reader_permissions = [
-                Permission.objects.get(
-                    codename='view_article', content_type=article_ct
-                ),
-                Permission.objects.get(
-                    codename='view_newsletter', content_type=newsletter_ct
-                ),
-                Permission.objects.get(
-                    codename='view_publisher', content_type=publisher_ct
-                ),
+                perm_map['view_article'],
+                perm_map['view_newsletter'],
+                perm_map['view_publisher'],
             ]
             
-            reader_group.permissions.set(reader_permissions)
             msg = (
                 f'  - Assigned {len(reader_permissions)} permissions '
                 'to Reader group'
@@ -99,34 +107,19 @@ class Command(BaseCommand):
             
             editor_permissions = [
                 # Article permissions
-                Permission.objects.get(
-                    codename='view_article', content_type=article_ct
-                ),
-                Permission.objects.get(
-                    codename='change_article', content_type=article_ct
-                ),
-                Permission.objects.get(
-                    codename='delete_article', content_type=article_ct
-                ),
+                perm_map['view_article'],
+                perm_map['change_article'],
+                perm_map['delete_article'],
                 
                 # Newsletter permissions
-                Permission.objects.get(
-                    codename='view_newsletter', content_type=newsletter_ct
-                ),
-                Permission.objects.get(
-                    codename='change_newsletter', content_type=newsletter_ct
-                ),
-                Permission.objects.get(
-                    codename='delete_newsletter', content_type=newsletter_ct
-                ),
+                perm_map['view_newsletter'],
+                perm_map['change_newsletter'],
+                perm_map['delete_newsletter'],
                 
                 # Publisher permissions (view only)
-                Permission.objects.get(
-                    codename='view_publisher', content_type=publisher_ct
-                ),
+                perm_map['view_publisher'],
             ]
             
-            editor_group.permissions.set(editor_permissions)
             msg = (
                 f'  - Assigned {len(editor_permissions)} permissions '
                 'to Editor group'
@@ -141,40 +134,21 @@ class Command(BaseCommand):
             
             journalist_permissions = [
                 # Article permissions (full CRUD)
-                Permission.objects.get(
-                    codename='add_article', content_type=article_ct
-                ),
-                Permission.objects.get(
-                    codename='view_article', content_type=article_ct
-                ),
-                Permission.objects.get(
-                    codename='change_article', content_type=article_ct
-                ),
-                Permission.objects.get(
-                    codename='delete_article', content_type=article_ct
-                ),
+                perm_map['add_article'],
+                perm_map['view_article'],
+                perm_map['change_article'],
+                perm_map['delete_article'],
                 
                 # Newsletter permissions (full CRUD)
-                Permission.objects.get(
-                    codename='add_newsletter', content_type=newsletter_ct
-                ),
-                Permission.objects.get(
-                    codename='view_newsletter', content_type=newsletter_ct
-                ),
-                Permission.objects.get(
-                    codename='change_newsletter', content_type=newsletter_ct
-                ),
-                Permission.objects.get(
-                    codename='delete_newsletter', content_type=newsletter_ct
-                ),
+                perm_map['add_newsletter'],
+                perm_map['view_newsletter'],
+                perm_map['change_newsletter'],
+                perm_map['delete_newsletter'],
                 
                 # Publisher permissions (view only)
-                Permission.objects.get(
-                    codename='view_publisher', content_type=publisher_ct
-                ),
+                perm_map['view_publisher'],
             ]
             
-            journalist_group.permissions.set(journalist_permissions)
             msg = (
                 f'  - Assigned {len(journalist_permissions)} permissions '
                 'to Journalist group'
@@ -183,6 +157,28 @@ class Command(BaseCommand):
             for perm in journalist_permissions:
                 self.stdout.write(f'    • {perm.name}')
             
+            # ===== SAVE PERMISSIONS =====
+            # Replace the permissions of all three groups with one DELETE
+            # and one INSERT on the through table
+            GroupPermission = Group.permissions.through
+            group_permissions = [
+                GroupPermission(group_id=group.id, permission_id=perm.id)
+                for group, permissions in (
+                    (reader_group, reader_permissions),
+                    (editor_group, editor_permissions),
+                    (journalist_group, journalist_permissions),
+                )
+                for perm in permissions
+            ]
+            GroupPermission.objects.filter(
+                group_id__in=[group.id for group in groups.values()]
+            ).delete()
+            GroupPermission.objects.bulk_create(
+                group_permissions,
+                batch_size=500,
+                ignore_conflicts=True,
+            )
+            
             # Success message
             self.stdout.write(self.style.SUCCESS(
                 '\n✓ Successfully set up all groups and permissions!'
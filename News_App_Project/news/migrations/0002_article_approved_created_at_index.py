@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-15 10:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['approved', '-created_at'], name='news_articl_approve_5940b7_idx'),
+        ),
+    ]
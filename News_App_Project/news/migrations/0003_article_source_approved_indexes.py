@@ -0,0 +1,21 @@
+# Generated by Django 4.2.27 on 2026-10-15 10:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_article_approved_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', 'approved'], name='news_articl_author__28bfc8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['publisher', 'approved'], name='news_articl_publish_aa93c0_idx'),
+        ),
+    ]
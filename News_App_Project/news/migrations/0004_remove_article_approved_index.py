@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-15 11:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_article_source_approved_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='news_articl_approve_79cbd7_idx',
+        ),
+    ]
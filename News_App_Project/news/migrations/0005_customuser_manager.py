@@ -0,0 +1,20 @@
+# Generated by Django 4.2.27 on 2026-10-15 11:05
+
+from django.db import migrations
+import news.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_remove_article_approved_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='customuser',
+            managers=[
+                ('objects', news.models.CustomUserManager()),
+            ],
+        ),
+    ]
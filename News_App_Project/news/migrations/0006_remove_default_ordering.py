@@ -0,0 +1,29 @@
+# Generated by Django 4.2.27 on 2026-10-15 11:13
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_customuser_manager'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='article',
+            options={'verbose_name': 'Article', 'verbose_name_plural': 'Articles'},
+        ),
+        migrations.AlterModelOptions(
+            name='customuser',
+            options={'verbose_name': 'User', 'verbose_name_plural': 'Users'},
+        ),
+        migrations.AlterModelOptions(
+            name='newsletter',
+            options={'verbose_name': 'Newsletter', 'verbose_name_plural': 'Newsletters'},
+        ),
+        migrations.AlterModelOptions(
+            name='publisher',
+            options={'verbose_name': 'Publisher', 'verbose_name_plural': 'Publishers'},
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.27 on 2026-10-15 11:37
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def populate_source_display(apps, schema_editor):
+    """
+    Fill source_display for existing articles, one batch at a time.
+
+    Historical models don't carry __str__, so the CustomUser and Publisher
+    formats are rebuilt here. Batches seek on the primary key, so only
+    BATCH_SIZE articles are held in memory, even on MySQL, whose client
+    buffers a whole result set.
+    """
+    Article = apps.get_model('news', 'Article')
+    CustomUser = apps.get_model('news', 'CustomUser')
+    role_labels = dict(CustomUser._meta.get_field('role').flatchoices)
+    articles = Article.objects.select_related('author', 'publisher').only(
+        'id', 'author__username', 'author__role', 'publisher__name'
+    ).order_by('pk')
+
+    last_pk = 0
+    while True:
+        batch = list(articles.filter(pk__gt=last_pk)[:BATCH_SIZE])
+        if not batch:
+            break
+        for article in batch:
+            if article.author_id:
+                author = article.author
+                source = f"{author.username} ({role_labels.get(author.role, author.role)})"
+            else:
+                source = article.publisher.name
+            article.source_display = source[:255]
+        Article.objects.bulk_update(batch, ['source_display'])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_remove_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='source_display',
+            field=models.CharField(blank=True, editable=False, help_text="Display name of the article's source", max_length=255),
+        ),
+        migrations.RunPython(populate_source_display, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.27 on 2026-10-15 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_article_source_display'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='article',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('author__isnull', False), ('publisher__isnull', True)), models.Q(('author__isnull', True), ('publisher__isnull', False)), _connector='OR'), name='article_author_xor_publisher', violation_error_message='Article must have either an author (journalist) or a publisher, but not both.'),
+        ),
+    ]
@@ -8,12 +8,77 @@ This module contains all database models for the news application including:
 - Newsletter: Curated collection of articles
 """
 
-from django.contrib.auth.models import AbstractUser, Group, Permission
+from functools import cached_property
+
+from django.contrib.auth.models import AbstractUser, Group, Permission, UserManager
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, Prefetch, Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
+# How long a reader's subscription IDs stay cached (seconds)
+SUBSCRIPTION_CACHE_TIMEOUT = 300
+
+
+# How long a serialized /api/users/me/ response stays cached (seconds)
+USER_DETAIL_CACHE_TIMEOUT = 30
+
+
+# How long the editors' count of articles awaiting approval stays cached
+# (seconds)
+PENDING_COUNT_CACHE_TIMEOUT = 30
+
+PENDING_COUNT_CACHE_KEY = 'news:pending_article_count'
+
+
+def subscription_cache_key(user_id):
+    """Build the cache key holding a reader's subscription IDs."""
+    return f'news:subscription_ids:{user_id}'
+
+
+def user_detail_cache_key(user_id):
+    """Build the cache key holding a user's serialized details."""
+    return f'news:user_detail:{user_id}'
+
+
+def pending_article_count():
+    """
+    Count the articles awaiting approval, caching the result.
+    
+    The count lives in the shared cache (see CACHES), so when article
+    saves and deletes drop it (see signals.py), as do approvals made with
+    ArticleQuerySet.approve(), every worker recounts. Any other update()
+    leaves it stale for at most PENDING_COUNT_CACHE_TIMEOUT seconds.
+    """
+    return cache.get_or_set(
+        PENDING_COUNT_CACHE_KEY,
+        lambda: Article.objects.filter(approved=False).count(),
+        PENDING_COUNT_CACHE_TIMEOUT,
+    )
+
+
+class CustomUserQuerySet(models.QuerySet):
+    """QuerySet with helpers for loading many users at once."""
+    
+    def with_subscriptions(self):
+        """
+        Prefetch subscribed publishers and journalists.
+        
+        get_subscriptions() then reads from the prefetch cache instead of
+        running two queries per user.
+        """
+        return self.prefetch_related(
+            'subscribed_publishers', 'subscribed_journalists'
+        )
+
+
+class CustomUserManager(UserManager.from_queryset(CustomUserQuerySet)):
+    """UserManager that also exposes the CustomUserQuerySet helpers."""
+
+
 class CustomUser(AbstractUser):
     """
     Custom user model with role-based functionality.
@@ -35,6 +100,13 @@ class CustomUser(AbstractUser):
         (JOURNALIST, 'Journalist'),
     ]
     
+    # Auth group each role is assigned to (see the setup_groups command)
+    ROLE_GROUP_NAMES = {
+        READER: 'Reader',
+        EDITOR: 'Editor',
+        JOURNALIST: 'Journalist',
+    }
+    
     # Common fields for all users
     role = models.CharField(
         max_length=20,
@@ -62,39 +134,73 @@ class CustomUser(AbstractUser):
         help_text=_("Journalists this reader is subscribed to")
     )
     
+    objects = CustomUserManager()
+    
     class Meta:
         verbose_name = _('User')
         verbose_name_plural = _('Users')
-        ordering = ['-date_joined']
     
     def __str__(self):
         return f"{self.username} ({self.get_role_display()})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the role as loaded, so save() can detect role changes."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_role = instance.__dict__.get('role')
+        return instance
+    
     def save(self, *args, **kwargs):
         """
         Override save to automatically assign users to appropriate groups
         based on their role and handle field validation.
+        
+        Group membership is only rewritten for new users and when the
+        saved role differs from the one loaded from the database.
         """
         is_new = self.pk is None
+        update_fields = kwargs.get('update_fields')
+        role_saved = update_fields is None or 'role' in update_fields
         super().save(*args, **kwargs)
         
         # Assign user to appropriate group based on role
-        if is_new or 'role' in kwargs.get('update_fields', []):
+        if role_saved and (is_new or self.role != getattr(self, '_loaded_role', None)):
             self._assign_to_group()
+        if role_saved:
+            self._loaded_role = self.role
     
     def _assign_to_group(self):
-        """Assign user to the appropriate group based on their role."""
-        # Remove user from all role-based groups
-        self.groups.filter(name__in=['Reader', 'Editor', 'Journalist']).delete()
+        """
+        Assign user to the appropriate group based on their role.
+        
+        Memberships are written on the through table directly: one DELETE
+        of the user's role group rows and one INSERT for the new group.
+        """
+        # Looked up on every call (roles rarely change), so a group
+        # recreated by another process is never referenced by a stale ID.
+        # Missing groups will be created by the management command.
+        group_ids = dict(Group.objects.filter(
+            name__in=self.ROLE_GROUP_NAMES.values()
+        ).values_list('name', 'id'))
+        role_group_ids = {
+            role: group_ids[group_name]
+            for role, group_name in self.ROLE_GROUP_NAMES.items()
+            if group_name in group_ids
+        }
+        
+        # Remove user from all role-based groups (the groups themselves stay)
+        UserGroup = CustomUser.groups.through
+        UserGroup.objects.filter(
+            customuser_id=self.pk,
+            group_id__in=list(role_group_ids.values())
+        ).delete()
         
         # Add user to the appropriate group
-        group_name = self.get_role_display()
-        try:
-            group = Group.objects.get(name=group_name)
-            self.groups.add(group)
-        except Group.DoesNotExist:
-            # Group will be created by management command
-            pass
+        if self.role in role_group_ids:
+            UserGroup.objects.create(
+                customuser_id=self.pk,
+                group_id=role_group_ids[self.role]
+            )
     
     def clean(self):
         """
@@ -104,33 +210,78 @@ class CustomUser(AbstractUser):
         super().clean()
         
         # Validate that journalists don't have reader-specific data
-        if self.role == self.JOURNALIST:
-            if self.pk:  # Only check if user exists
-                if self.subscribed_publishers.exists() or self.subscribed_journalists.exists():
-                    raise ValidationError(
-                        _("Journalists cannot have reader subscriptions.")
-                    )
+        if self.role == self.JOURNALIST and self.pk:  # Only check if user exists
+            # Query the through tables directly, without joining the
+            # publisher and user tables
+            has_subscriptions = (
+                CustomUser.subscribed_publishers.through.objects.filter(
+                    customuser_id=self.pk
+                ).exists() or
+                CustomUser.subscribed_journalists.through.objects.filter(
+                    from_customuser_id=self.pk
+                ).exists()
+            )
+            if has_subscriptions:
+                raise ValidationError(
+                    _("Journalists cannot have reader subscriptions.")
+                )
     
     def get_authored_articles(self):
         """Get all articles authored by this user (for journalists)."""
         if self.role == self.JOURNALIST:
             return self.authored_articles.all()
-        return []
+        return self.authored_articles.none()
     
     def get_authored_newsletters(self):
         """Get all newsletters authored by this user (for journalists)."""
         if self.role == self.JOURNALIST:
             return self.authored_newsletters.all()
-        return []
+        return self.authored_newsletters.none()
     
     def get_subscriptions(self):
-        """Get all subscriptions for this user (for readers)."""
+        """
+        Get all subscriptions for this user (for readers).
+        
+        Always returns QuerySets. They are served from the prefetch cache
+        when the user was loaded with with_subscriptions().
+        """
         if self.role == self.READER:
             return {
                 'publishers': self.subscribed_publishers.all(),
                 'journalists': self.subscribed_journalists.all()
             }
-        return {'publishers': [], 'journalists': []}
+        return {
+            'publishers': self.subscribed_publishers.none(),
+            'journalists': self.subscribed_journalists.none()
+        }
+    
+    def get_subscription_ids(self):
+        """
+        Get the IDs of subscribed publishers and journalists (for readers).
+        
+        IDs are memoized on the instance for the rest of the request and
+        cached across requests in the shared cache (Redis, see CACHES), so
+        every worker sees the invalidation when the subscriptions change.
+        """
+        if not hasattr(self, '_subscription_ids'):
+            self._subscription_ids = cache.get_or_set(
+                subscription_cache_key(self.pk),
+                lambda: {
+                    'publishers': list(
+                        self.subscribed_publishers.values_list('id', flat=True)
+                    ),
+                    'journalists': list(
+                        self.subscribed_journalists.values_list('id', flat=True)
+                    ),
+                },
+                SUBSCRIPTION_CACHE_TIMEOUT,
+            )
+        return self._subscription_ids
+    
+    @cached_property
+    def display_name(self):
+        """Full name, or the username when no name is set."""
+        return self.get_full_name() or self.username
     
     @property
     def is_reader(self):
@@ -202,7 +353,6 @@ class Publisher(models.Model):
     class Meta:
         verbose_name = _('Publisher')
         verbose_name_plural = _('Publishers')
-        ordering = ['name']
     
     def __str__(self):
         return self.name
@@ -216,6 +366,59 @@ class Publisher(models.Model):
         return self.articles.filter(approved=True)
 
 
+class ArticleQuerySet(models.QuerySet):
+    """QuerySet with the article visibility rules."""
+    
+    def viewable_by(self, user):
+        """
+        Restrict to the articles `user` may view.
+        
+        - Editors and superusers: All articles
+        - Journalists: Their own articles + all approved articles
+        - Readers: Only approved articles
+        
+        Mirrors CanViewArticle, which still guards single-object access.
+        """
+        if user.is_superuser or user.role == CustomUser.EDITOR:
+            return self
+        q = Q(approved=True)
+        if user.role == CustomUser.JOURNALIST:
+            q |= Q(author_id=user.id)
+        return self.filter(q)
+    
+    def approve(self, editor):
+        """
+        Approve every unapproved article in the queryset with one UPDATE.
+        
+        save() and its signals are skipped, so nothing is queued here;
+        pass the returned IDs to queue_bulk_post_approval_actions().
+        
+        Args:
+            editor: The CustomUser approving the articles
+        
+        Returns:
+            List of IDs of the articles this call approved
+        """
+        now = timezone.now()
+        with transaction.atomic(using=self.db):
+            # Lock the rows so a concurrent approval can't notify twice
+            article_ids = list(
+                self.filter(approved=False).select_for_update().values_list(
+                    'pk', flat=True
+                )
+            )
+            if article_ids:
+                self.model.objects.filter(pk__in=article_ids).update(
+                    approved=True,
+                    approved_by=editor,
+                    approved_at=now,
+                    updated_at=now,
+                )
+        if article_ids:
+            cache.delete(PENDING_COUNT_CACHE_KEY)
+        return article_ids
+
+
 class Article(models.Model):
     """
     Article model representing news articles.
@@ -257,6 +460,15 @@ class Article(models.Model):
         help_text=_("Publisher (for publisher content)")
     )
     
+    # str() of the author or publisher, kept in sync by save() and the
+    # CustomUser/Publisher post_save handlers so lists don't compute it
+    source_display = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text=_("Display name of the article's source")
+    )
+    
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text=_("When the article was created")
@@ -289,13 +501,30 @@ class Article(models.Model):
         help_text=_("When the article was approved")
     )
     
+    objects = ArticleQuerySet.as_manager()
+    
     class Meta:
         verbose_name = _('Article')
         verbose_name_plural = _('Articles')
-        ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
-            models.Index(fields=['approved']),
+            models.Index(fields=['approved', '-created_at']),
+            models.Index(fields=['author', 'approved']),
+            models.Index(fields=['publisher', 'approved']),
+        ]
+        constraints = [
+            # Same rule as _validate_source(), enforced by the database
+            models.CheckConstraint(
+                check=(
+                    Q(author__isnull=False, publisher__isnull=True) |
+                    Q(author__isnull=True, publisher__isnull=False)
+                ),
+                name='article_author_xor_publisher',
+                violation_error_message=_(
+                    "Article must have either an author (journalist) or a "
+                    "publisher, but not both."
+                ),
+            ),
         ]
     
     def __str__(self):
@@ -307,24 +536,52 @@ class Article(models.Model):
         This ensures proper normalization.
         """
         super().clean()
+        self._validate_source()
+    
+    def _validate_source(self):
+        """
+        Enforce the author/publisher rule.
         
+        Uses the raw foreign key IDs, so no related rows are fetched.
+        """
         # Article must have either author or publisher, but not both
-        if self.author and self.publisher:
+        if self.author_id and self.publisher_id:
             raise ValidationError(
                 _("Article cannot have both an author and a publisher. "
                   "Use author for independent articles or publisher for publisher content.")
             )
         
-        if not self.author and not self.publisher:
+        if not self.author_id and not self.publisher_id:
             raise ValidationError(
                 _("Article must have either an author (journalist) or a publisher.")
             )
     
     def save(self, *args, **kwargs):
-        """Override save to run validation."""
-        self.full_clean()
+        """
+        Override save to enforce the author/publisher rule.
+        
+        Field validation (full_clean) is left to forms and serializers,
+        so saving doesn't run every validator again. source_display is
+        only recomputed when the save writes the source, so e.g. saving
+        just the approval fields doesn't load the author or publisher.
+        """
+        self._validate_source()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.refresh_source_display()
+        elif {'author', 'publisher'} & set(update_fields):
+            self.refresh_source_display()
+            kwargs['update_fields'] = {*update_fields, 'source_display'}
         super().save(*args, **kwargs)
     
+    def refresh_source_display(self):
+        """
+        Recompute source_display from the author or publisher.
+        
+        Call this before bulk_create(), which bypasses save().
+        """
+        self.source_display = str(self.get_source())[:255]
+    
     def get_source(self):
         """Get the source of the article (author or publisher)."""
         if self.author:
@@ -334,12 +591,41 @@ class Article(models.Model):
     @property
     def is_independent(self):
         """Check if this is an independent article (has author)."""
-        return self.author is not None
+        return self.author_id is not None
     
     @property
     def is_publisher_content(self):
         """Check if this is publisher content."""
-        return self.publisher is not None
+        return self.publisher_id is not None
+
+
+class NewsletterQuerySet(models.QuerySet):
+    """QuerySet with helpers for rendering many newsletters at once."""
+    
+    def with_article_count(self):
+        """
+        Annotate article counts, so get_article_count() needs no query.
+        
+        For pages that show counts but not the articles themselves.
+        """
+        return self.annotate(article_count=Count('articles', distinct=True))
+    
+    def with_counts(self):
+        """
+        Annotate article counts and prefetch approved articles.
+        
+        Lets get_article_count() and get_approved_articles() answer from
+        memory instead of running a query per newsletter.
+        """
+        return self.with_article_count().prefetch_related(
+            Prefetch(
+                'articles',
+                queryset=Article.objects.filter(approved=True).select_related(
+                    'author', 'publisher', 'approved_by'
+                ).order_by('-created_at'),
+                to_attr='_approved_articles'
+            )
+        )
 
 
 class Newsletter(models.Model):
@@ -386,10 +672,11 @@ class Newsletter(models.Model):
         help_text=_("When the newsletter was last updated")
     )
     
+    objects = NewsletterQuerySet.as_manager()
+    
     class Meta:
         verbose_name = _('Newsletter')
         verbose_name_plural = _('Newsletters')
-        ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
         ]
@@ -398,9 +685,22 @@ class Newsletter(models.Model):
         return self.title
     
     def get_article_count(self):
-        """Get the number of articles in this newsletter."""
+        """
+        Get the number of articles in this newsletter.
+        
+        Uses the with_counts() annotation when present.
+        """
+        if hasattr(self, 'article_count'):
+            return self.article_count
         return self.articles.count()
     
     def get_approved_articles(self):
-        """Get only approved articles in this newsletter."""
-        return self.articles.filter(approved=True)
+        """
+        Get only approved articles in this newsletter.
+        
+        Returns the list prefetched by with_counts() when present,
+        otherwise a QuerySet.
+        """
+        if hasattr(self, '_approved_articles'):
+            return self._approved_articles
+        return self.articles.filter(approved=True).order_by('-created_at')
@@ -0,0 +1,159 @@
+"""
+Pagination Classes for News API
+
+This module provides:
+- A page-number paginator that avoids an exact COUNT(*) over large,
+  unfiltered tables by using the database's own row-count estimate
+- Cursor paginators that seek on an indexed column instead of using OFFSET
+"""
+
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+# Below this many rows an exact COUNT(*) is cheap and estimates are
+# unreliable, so the real count is used instead.
+ESTIMATE_THRESHOLD = 10000
+
+ESTIMATE_QUERIES = {
+    'mysql': (
+        "SELECT TABLE_ROWS FROM information_schema.TABLES "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s"
+    ),
+    'postgresql': (
+        "SELECT reltuples::bigint FROM pg_class WHERE relname = %s"
+    ),
+}
+
+
+def estimate_row_count(queryset):
+    """
+    Get the estimated number of rows for an unfiltered queryset.
+
+    Args:
+        queryset: QuerySet being paginated
+
+    Returns:
+        Estimated row count, or None if an exact count should be used
+    """
+    if not hasattr(queryset, 'query') or queryset.query.where:
+        # Estimates only describe a whole table
+        return None
+
+    connection = connections[queryset.db]
+    sql = ESTIMATE_QUERIES.get(connection.vendor)
+    if sql is None:
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [queryset.model._meta.db_table])
+        row = cursor.fetchone()
+
+    if not row or row[0] is None or row[0] < ESTIMATE_THRESHOLD:
+        return None
+    return int(row[0])
+
+
+class EstimatedPage(Page):
+    """
+    Page that knows whether rows follow it, rather than trusting the
+    paginator's estimated page count.
+    """
+
+    # Set by EstimatedCountPaginator.page() when the count is an estimate
+    has_more = None
+
+    def has_next(self):
+        if self.has_more is None:
+            return super().has_next()
+        return self.has_more
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Django paginator that uses the table statistics for its count
+    when the queryset is unfiltered and the table is large.
+
+    Table statistics can undercount, so with an estimate, pages past the
+    estimated last page are still served while they hold rows, and each
+    page checks for a following row itself.
+    """
+
+    @cached_property
+    def estimated_count(self):
+        """Return the estimated row count, or None if it isn't used."""
+        return estimate_row_count(self.object_list)
+
+    @cached_property
+    def count(self):
+        """Return the estimated row count, falling back to an exact count."""
+        if self.estimated_count is not None:
+            return self.estimated_count
+        return super().count
+
+    def validate_number(self, number):
+        """Validate a page number, allowing pages past an estimated count."""
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            number = int(number)
+            if self.estimated_count is None or number < 1:
+                raise
+            # page() raises EmptyPage itself if no rows are left
+            return number
+
+    def page(self, number):
+        """Return the given page, reading one extra row if estimated."""
+        if self.estimated_count is None:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        # The extra row tells whether another page follows
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > self.num_pages:
+            raise EmptyPage('That page contains no results')
+
+        page = self._get_page(rows[:self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+    def get_page(self, number):
+        """Return a valid page, like Paginator.get_page()."""
+        try:
+            return super().get_page(number)
+        except EmptyPage:
+            # Past the last row of an estimated count; page() only raises
+            # beyond num_pages, so this one is always served
+            return self.page(self.num_pages)
+
+    def _get_page(self, *args, **kwargs):
+        return EstimatedPage(*args, **kwargs)
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Page-number pagination backed by EstimatedCountPaginator.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Cursor pagination ordered by primary key.
+    """
+
+    ordering = 'id'
+    page_size = 50
+
+
+class NameCursorPagination(CursorPagination):
+    """
+    Cursor pagination ordered by a unique (and therefore indexed) name.
+    """
+
+    ordering = 'name'
+    page_size = 50
@@ -9,6 +9,25 @@ from rest_framework import permissions
 from .models import CustomUser
 
 
+def has_role(request, roles):
+    """
+    Check that the request user is authenticated and has one of `roles`.
+    
+    Superusers pass every role check.
+    
+    Args:
+        request: The DRF request
+        roles: Collection of role values, e.g. (CustomUser.EDITOR,)
+    
+    Returns:
+        True if the user may act in one of the given roles
+    """
+    user = request.user
+    if not (user and user.is_authenticated):
+        return False
+    return user.is_superuser or user.role in roles
+
+
 class IsEditor(permissions.BasePermission):
     """
     Permission class to check if user has Editor role.
@@ -16,11 +35,7 @@ class IsEditor(permissions.BasePermission):
     
     def has_permission(self, request, view):
         """Check if user is an editor."""
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == CustomUser.EDITOR
-        )
+        return has_role(request, (CustomUser.EDITOR,))
 
 
 class IsJournalist(permissions.BasePermission):
@@ -30,11 +45,7 @@ class IsJournalist(permissions.BasePermission):
     
     def has_permission(self, request, view):
         """Check if user is a journalist."""
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == CustomUser.JOURNALIST
-        )
+        return has_role(request, (CustomUser.JOURNALIST,))
 
 
 class IsReader(permissions.BasePermission):
@@ -44,11 +55,7 @@ class IsReader(permissions.BasePermission):
     
     def has_permission(self, request, view):
         """Check if user is a reader."""
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == CustomUser.READER
-        )
+        return has_role(request, (CustomUser.READER,))
 
 
 class IsEditorOrJournalist(permissions.BasePermission):
@@ -58,11 +65,7 @@ class IsEditorOrJournalist(permissions.BasePermission):
     
     def has_permission(self, request, view):
         """Check if user is an editor or journalist."""
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role in [CustomUser.EDITOR, CustomUser.JOURNALIST]
-        )
+        return has_role(request, (CustomUser.EDITOR, CustomUser.JOURNALIST))
 
 
 class IsJournalistOrReadOnly(permissions.BasePermission):
@@ -79,11 +82,7 @@ class IsJournalistOrReadOnly(permissions.BasePermission):
             return request.user and request.user.is_authenticated
         
         # Write permissions only for journalists
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == CustomUser.JOURNALIST
-        )
+        return has_role(request, (CustomUser.JOURNALIST,))
 
 
 class CanModifyArticle(permissions.BasePermission):
@@ -101,13 +100,14 @@ class CanModifyArticle(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return request.user and request.user.is_authenticated
         
-        # Editors can modify any article
-        if request.user.role == CustomUser.EDITOR:
+        # Editors (and superusers) can modify any article
+        if has_role(request, (CustomUser.EDITOR,)):
             return True
         
         # Journalists can only modify their own articles
+        # (compare IDs so the author row isn't fetched)
         if request.user.role == CustomUser.JOURNALIST:
-            return obj.author == request.user
+            return obj.author_id == request.user.id
         
         # Readers cannot modify
         return False
@@ -122,19 +122,11 @@ class CanApproveArticle(permissions.BasePermission):
     
     def has_permission(self, request, view):
         """Check if user can approve articles."""
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == CustomUser.EDITOR
-        )
+        return has_role(request, (CustomUser.EDITOR,))
     
     def has_object_permission(self, request, view, obj):
         """Check if user can approve this specific article."""
-        return (
-            request.user and
-            request.user.is_authenticated and
-            request.user.role == CustomUser.EDITOR
-        )
+        return has_role(request, (CustomUser.EDITOR,))
 
 
 class CanViewArticle(permissions.BasePermission):
@@ -154,8 +146,8 @@ class CanViewArticle(permissions.BasePermission):
         if not user or not user.is_authenticated:
             return False
         
-        # Editors can view all articles
-        if user.role == CustomUser.EDITOR:
+        # Editors (and superusers) can view all articles
+        if user.is_superuser or user.role == CustomUser.EDITOR:
             return True
         
         # Approved articles visible to all authenticated users
@@ -163,7 +155,7 @@ class CanViewArticle(permissions.BasePermission):
             return True
         
         # Journalists can view their own unapproved articles
-        if user.role == CustomUser.JOURNALIST and obj.author == user:
+        if user.role == CustomUser.JOURNALIST and obj.author_id == user.id:
             return True
         
         # Readers cannot view unapproved articles
@@ -0,0 +1,42 @@
+"""
+Renderers for News API
+
+This module provides a JSON renderer backed by orjson, which serializes
+large article listings considerably faster than the standard library.
+"""
+
+import orjson
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that uses orjson for compact output.
+
+    Pretty-printed output (e.g. 'application/json; indent=4' or the
+    browsable API) is still rendered by DRF's standard JSONRenderer.
+    """
+
+    # Handles the types orjson doesn't know, e.g. Decimal and lazy strings
+    _encoder = JSONEncoder()
+
+    # Accept int and other non-str dict keys, as the stdlib encoder does
+    _options = orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self._encoder.default, option=self._options)
+
+        # Escape \u2028 and \u2029 like JSONRenderer, so the output stays
+        # a strict JavaScript subset
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
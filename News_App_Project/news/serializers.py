@@ -5,14 +5,55 @@ This module defines serializers for converting model instances to/from JSON
 for the RESTful API endpoints.
 """
 
+import copy
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import models
 from .models import Article, Newsletter, Publisher
 
 User = get_user_model()
 
+# Unbound fields per serializer class, filled by CachedFieldsMixin
+_fields_cache = {}
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and hand out shallow copies.
+    
+    ModelSerializer.get_fields() introspects the model on every
+    instantiation, which adds up when a nested serializer is created per
+    row. Only use this on serializers whose fields don't depend on the
+    instance or the context.
+    """
+    
+    def get_fields(self):
+        """Return copies of the fields built for the first instance."""
+        cls = type(self)
+        fields = _fields_cache.get(cls)
+        if fields is None:
+            fields = _fields_cache[cls] = super().get_fields()
+        return {name: self._copy_field(field) for name, field in fields.items()}
+    
+    @staticmethod
+    def _copy_field(field):
+        """
+        Shallow-copy a cached field for one serializer instance.
+        
+        A many-to-many field holds a child relation bound to it at
+        construction. A plain copy would share that child, whose parent
+        (and so root and context) is the unbound cached field, so the
+        child is copied too and re-parented onto the copy.
+        """
+        field = copy.copy(field)
+        if isinstance(field, serializers.ManyRelatedField):
+            field.child_relation = copy.copy(field.child_relation)
+            field.child_relation.parent = field
+        return field
+
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for CustomUser model.
     
@@ -27,7 +68,7 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'role_display']
 
 
-class PublisherSerializer(serializers.ModelSerializer):
+class PublisherSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Publisher model.
     
@@ -42,21 +83,54 @@ class PublisherSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
     
     def get_article_count(self, obj):
-        """Get the number of approved articles for this publisher."""
+        """
+        Get the number of approved articles for this publisher.
+        
+        Uses the approved_article_count annotation when the view provides
+        it (see PublisherViewSet.get_queryset).
+        """
+        if hasattr(obj, 'approved_article_count'):
+            return obj.approved_article_count
         return obj.articles.filter(approved=True).count()
 
 
-class ArticleListSerializer(serializers.ModelSerializer):
+class ArticleSummaryListSerializer(serializers.ListSerializer):
+    """
+    Serializes article lists in one pass.
+    
+    Names of authors, publishers and approving editors are computed once
+    per related object and shared across the whole list.
+    """
+    
+    def to_representation(self, data):
+        """Serialize every article with one shared name cache."""
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        names = {}
+        return [self.child.summarize(article, names) for article in iterable]
+
+
+class ArticleListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Article list views.
     
-    Provides summary information for article listings.
+    Provides summary information for article listings. Reads author,
+    publisher and approved_by, so querysets passed in should
+    select_related() all three.
+    
+    Output is built by summarize() rather than field by field; the
+    declared fields still describe the output for the browsable API.
     """
     
-    author_name = serializers.SerializerMethodField()
-    publisher_name = serializers.SerializerMethodField()
-    source = serializers.SerializerMethodField()
-    approved_by_name = serializers.SerializerMethodField()
+    author_name = serializers.CharField(
+        source='author.display_name', read_only=True, default=None
+    )
+    publisher_name = serializers.CharField(
+        source='publisher.name', read_only=True, default=None
+    )
+    source = serializers.CharField(source='source_display', read_only=True)
+    approved_by_name = serializers.CharField(
+        source='approved_by.display_name', read_only=True, default=None
+    )
     
     class Meta:
         model = Article
@@ -66,29 +140,61 @@ class ArticleListSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'approved_by', 'approved_at']
+        list_serializer_class = ArticleSummaryListSerializer
     
-    def get_author_name(self, obj):
-        """Get the author's full name or username."""
-        if obj.author:
-            return obj.author.get_full_name() or obj.author.username
-        return None
-    
-    def get_publisher_name(self, obj):
-        """Get the publisher's name."""
-        return obj.publisher.name if obj.publisher else None
-    
-    def get_source(self, obj):
-        """Get the source of the article (author or publisher)."""
-        return str(obj.get_source())
+    def to_representation(self, instance):
+        """Serialize a single article."""
+        return self.summarize(instance, {})
     
-    def get_approved_by_name(self, obj):
-        """Get the name of the editor who approved the article."""
-        if obj.approved_by:
-            return obj.approved_by.get_full_name() or obj.approved_by.username
-        return None
+    def summarize(self, obj, names):
+        """
+        Build the output dict for one article.
+        
+        Keys follow Meta.fields. Values that only depend on a related row
+        are cached in `names`, keyed by field and related ID.
+        
+        Args:
+            obj: The Article instance
+            names: Dict shared by every article in the list
+        
+        Returns:
+            Dict of serialized article data
+        """
+        def cached(field, related_id, getter):
+            key = (field, related_id)
+            if key not in names:
+                names[key] = getter()
+            return names[key]
+        
+        def display_name(user):
+            return user.display_name if user else None
+        
+        fields = self.fields
+        return {
+            'id': obj.id,
+            'title': obj.title,
+            'author': obj.author_id,
+            'author_name': cached(
+                'author_name', obj.author_id, lambda: display_name(obj.author)
+            ),
+            'publisher': obj.publisher_id,
+            'publisher_name': cached(
+                'publisher_name', obj.publisher_id,
+                lambda: obj.publisher.name if obj.publisher else None
+            ),
+            'source': obj.source_display,
+            'approved': obj.approved,
+            'approved_by': obj.approved_by_id,
+            'approved_by_name': cached(
+                'approved_by_name', obj.approved_by_id,
+                lambda: display_name(obj.approved_by)
+            ),
+            'created_at': fields['created_at'].to_representation(obj.created_at),
+            'updated_at': fields['updated_at'].to_representation(obj.updated_at),
+        }
 
 
-class ArticleDetailSerializer(serializers.ModelSerializer):
+class ArticleDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Article detail views.
     
@@ -98,7 +204,7 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
     author_details = UserSerializer(source='author', read_only=True)
     publisher_details = PublisherSerializer(source='publisher', read_only=True)
     approved_by_details = UserSerializer(source='approved_by', read_only=True)
-    source = serializers.SerializerMethodField()
+    source = serializers.CharField(source='source_display', read_only=True)
     is_independent = serializers.BooleanField(read_only=True)
     is_publisher_content = serializers.BooleanField(read_only=True)
     
@@ -113,10 +219,6 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'approved_by', 'approved_at', 'created_at', 'updated_at']
     
-    def get_source(self, obj):
-        """Get the source of the article."""
-        return str(obj.get_source())
-    
     def validate(self, data):
         """
         Validate that article has either author OR publisher, not both.
@@ -154,20 +256,27 @@ class ArticleCreateSerializer(serializers.ModelSerializer):
         model = Article
         fields = ['title', 'content', 'author', 'publisher']
     
+    def validate_author(self, value):
+        """Ensure journalists only name themselves as the author."""
+        request = self.context.get('request')
+        user = request.user if request else None
+        
+        if value and user and user.is_journalist and value.pk != user.pk:
+            raise serializers.ValidationError(
+                "Journalists can only create articles for themselves."
+            )
+        return value
+    
     def validate(self, data):
         """
-        Validate article creation.
+        Validate mutual exclusivity of author/publisher.
         
-        - Ensure user is creating for themselves or a valid publisher
-        - Validate mutual exclusivity of author/publisher
+        The article_author_xor_publisher constraint enforces the same rule
+        in the database; checking here turns it into a 400 response.
         """
-        request = self.context.get('request')
-        user = request.user if request else None
-        
         author = data.get('author')
         publisher = data.get('publisher')
         
-        # Validate mutual exclusivity
         if author and publisher:
             raise serializers.ValidationError(
                 "Article cannot have both an author and a publisher."
@@ -178,21 +287,16 @@ class ArticleCreateSerializer(serializers.ModelSerializer):
                 "Article must have either an author or a publisher."
             )
         
-        # Validate journalist is creating for themselves
-        if user and user.is_journalist and author:
-            if author != user:
-                raise serializers.ValidationError(
-                    "Journalists can only create articles for themselves."
-                )
-        
         return data
 
 
-class NewsletterSerializer(serializers.ModelSerializer):
+class NewsletterSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Newsletter model.
     
-    Includes articles and author information.
+    Includes articles and author information. For lists, load newsletters
+    with Newsletter.objects.with_counts() and prefetch 'articles' with
+    their related rows (see NewsletterViewSet.get_queryset).
     """
     
     author_details = UserSerializer(source='author', read_only=True)
@@ -5,58 +5,199 @@ This module contains signal handlers for post-approval actions on articles:
 1. Send email notifications to subscribers
 2. Post approved articles to Twitter/X
 
-Signals are triggered automatically when articles are approved.
+Signals are triggered automatically when articles are approved. The
+email and Twitter/X post are queued as separate Celery tasks once the
+approving transaction commits, so the request does not wait on network
+calls.
 """
 
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.core.signals import setting_changed
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
-from django.core.mail import send_mail
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
 from django.utils import timezone
+from functools import lru_cache
+from itertools import islice
 import requests
 import logging
+import threading
 
-from .models import Article, CustomUser
+from .models import (
+    Article,
+    CustomUser,
+    Publisher,
+    PENDING_COUNT_CACHE_KEY,
+    subscription_cache_key,
+    user_detail_cache_key
+)
+from .tasks import (
+    post_article_to_twitter,
+    post_articles_to_twitter,
+    run_bulk_post_approval_actions,
+    run_post_approval_actions,
+    send_article_email,
+    send_article_emails
+)
 
 # Set up logging for debugging and error tracking
 logger = logging.getLogger(__name__)
 
+# Number of notification emails built and sent at a time
+EMAIL_BATCH_SIZE = 500
 
-@receiver(pre_save, sender=Article)
-def track_approval_changes(sender, instance, **kwargs):
+# Body of the new-article notification; filled with str.format()
+EMAIL_MESSAGE_TEMPLATE = (
+    "Hello,\n"
+    "\n"
+    "A new article has been published by {source_name} ({source_type}).\n"
+    "\n"
+    "Title: {title}\n"
+    "\n"
+    "{preview}\n"
+    "\n"
+    "---\n"
+    "This is an automated notification from Dispatch."
+)
+
+# Characters of the article body included in the notification
+EMAIL_PREVIEW_LENGTH = 200
+
+# Twitter API v2 endpoint for creating tweets
+TWITTER_TWEETS_URL = "https://api.twitter.com/2/tweets"
+
+# Settings holding the Twitter/X credentials, with the placeholder values
+# shipped in settings.py
+TWITTER_CREDENTIAL_PLACEHOLDERS = {
+    'TWITTER_API_KEY': 'your-twitter-api-key',
+    'TWITTER_API_SECRET': 'your-twitter-api-secret',
+    'TWITTER_ACCESS_TOKEN': 'your-access-token',
+    'TWITTER_ACCESS_TOKEN_SECRET': 'your-access-token-secret',
+}
+
+
+# dispatch_uid keeps the approval handlers registered once even if this
+# module is imported under a second name, which would double every email
+@receiver(pre_save, sender=Article, dispatch_uid='article_track_approval')
+def track_approval_changes(sender, instance, update_fields=None, **kwargs):
     """
     Track when an article's approval status changes.
     
     This signal runs before saving and stores whether the article
     was just approved so we can trigger post-approval actions.
+    Only the stored approved flag is read, never the whole row.
+    
+    A missing approval timestamp is filled in here, so it is written by
+    the same UPDATE as the approval.
     """
-    if instance.pk:  # Only for existing articles
-        try:
-            old_instance = Article.objects.get(pk=instance.pk)
-            # Check if article was just approved
-            instance._was_just_approved = (
-                not old_instance.approved and instance.approved
-            )
-        except Article.DoesNotExist:
-            instance._was_just_approved = False
+    instance._was_just_approved = False
+    
+    # New articles, and saves that don't write approved, can't approve
+    if not instance.pk or not instance.approved:
+        return
+    if update_fields is not None and 'approved' not in update_fields:
+        return
+    
+    was_approved = Article.objects.filter(pk=instance.pk).values_list(
+        'approved', flat=True
+    ).first()
+    # None means the row doesn't exist yet (e.g. an explicit pk)
+    instance._was_just_approved = was_approved is False
+    
+    if instance._was_just_approved and not instance.approved_at:
+        instance.approved_at = timezone.now()
+
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_publishers.through)
+@receiver(m2m_changed, sender=CustomUser.subscribed_journalists.through)
+def invalidate_subscription_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Drop cached subscription IDs for every reader whose subscriptions changed.
+    
+    Handles changes made from either side of the relation, e.g.
+    reader.subscribed_publishers.add(publisher) and
+    publisher.subscribers.add(reader).
+    """
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    
+    if not reverse:
+        reader_ids = [instance.pk]
+    elif pk_set is not None:
+        reader_ids = pk_set
+    elif sender is CustomUser.subscribed_publishers.through:
+        # Reverse clear: find the readers before the rows are removed
+        reader_ids = instance.subscribers.values_list('id', flat=True)
     else:
-        instance._was_just_approved = False
+        reader_ids = instance.journalist_subscribers.values_list('id', flat=True)
+    
+    cache.delete_many([subscription_cache_key(pk) for pk in reader_ids])
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_user_detail_cache(sender, instance, **kwargs):
+    """Drop cached user details and subscription IDs when a user is saved."""
+    cache.delete_many([
+        user_detail_cache_key(instance.pk),
+        subscription_cache_key(instance.pk),
+    ])
 
 
 @receiver(post_save, sender=Article)
-def handle_article_approval(sender, instance, created, **kwargs):
+@receiver(post_delete, sender=Article)
+def invalidate_pending_count(sender, **kwargs):
+    """Drop the cached count of articles awaiting approval."""
+    cache.delete(PENDING_COUNT_CACHE_KEY)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_save, sender=Publisher)
+def sync_article_source_display(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Rewrite source_display on the instance's articles after a rename.
+    
+    CustomUser.__str__ uses username and role, Publisher.__str__ uses name;
+    saves that touch neither (e.g. last_login on login) are skipped, as are
+    users who neither are nor were journalists, since only journalists
+    author articles.
+    """
+    if created:
+        return
+    if sender is CustomUser:
+        # _loaded_role still holds the previous role during post_save
+        if CustomUser.JOURNALIST not in (
+            instance.role, getattr(instance, '_loaded_role', None)
+        ):
+            return
+        source_fields = {'username', 'role'}
+        articles = Article.objects.filter(author_id=instance.pk)
+    else:
+        source_fields = {'name'}
+        articles = Article.objects.filter(publisher_id=instance.pk)
+    if update_fields is not None and not source_fields & set(update_fields):
+        return
+    
+    source_display = str(instance)[:255]
+    articles.exclude(source_display=source_display).update(
+        source_display=source_display
+    )
+
+
+@receiver(post_save, sender=Article, dispatch_uid='article_handle_approval')
+def handle_article_approval(sender, instance, created, update_fields=None, **kwargs):
     """
     Handle post-approval actions for articles.
     
-    When an article is approved:
-    1. Update approval timestamp
-    2. Send email notifications to subscribers
-    3. Post to Twitter/X
+    When an article is approved, queue the email and Twitter/X tasks
+    after commit. The approval timestamp was already set in pre_save.
     
     Args:
         sender: The model class (Article)
         instance: The actual Article instance
         created: Boolean indicating if this is a new article
+        update_fields: Fields passed to save(), if any
         **kwargs: Additional keyword arguments
     """
     # Only proceed if article was just approved
@@ -68,32 +209,68 @@ def handle_article_approval(sender, instance, created, **kwargs):
         "Triggering post-approval actions..."
     )
     
-    # Update approval timestamp if not already set
-    if not instance.approved_at:
-        instance.approved_at = timezone.now()
-        # Use update() to avoid triggering signals again
-        Article.objects.filter(pk=instance.pk).update(
+    # save(update_fields=[...]) without approved_at didn't write the
+    # timestamp set in pre_save; use update() to avoid signals again
+    if update_fields is not None and 'approved_at' not in update_fields:
+        Article.objects.filter(pk=instance.pk, approved_at__isnull=True).update(
             approved_at=instance.approved_at
         )
     
-    try:
-        # 1. Send email notifications to subscribers
-        send_email_to_subscribers(instance)
-        
-        # 2. Post to Twitter/X
-        post_to_twitter(instance)
-        
-        logger.info(
-            f"Successfully completed post-approval actions "
-            f"for article '{instance.title}'"
-        )
-        
-    except Exception as e:
-        logger.error(
-            f"Error in post-approval actions "
-            f"for article '{instance.title}': {str(e)}"
-        )
-        # Don't raise - we don't want to prevent article from being saved
+    queue_post_approval_actions(instance.pk)
+
+
+def queue_post_approval_actions(article_id):
+    """
+    Queue the post-approval tasks for an approved article.
+    
+    1. send_article_email: email subscribers
+    2. post_article_to_twitter: post to Twitter/X
+    
+    The tasks are only queued once the approval is committed, so workers
+    never see an unapproved (or rolled back) article. Call this directly
+    when an article is approved without save(), e.g. via QuerySet.update().
+    
+    When Celery runs tasks eagerly (development, no worker), both actions
+    are handed to a thread pool instead, so the request doesn't wait on
+    them either.
+    
+    Args:
+        article_id: Primary key of the approved Article
+    """
+    def enqueue():
+        if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+            run_post_approval_actions(article_id)
+        else:
+            send_article_email.delay(article_id)
+            post_article_to_twitter.delay(article_id)
+    
+    transaction.on_commit(enqueue)
+
+
+def queue_bulk_post_approval_actions(article_ids):
+    """
+    Queue one email task and one Twitter/X task for many approved articles.
+    
+    Used after ArticleQuerySet.approve(), which approves with a single
+    UPDATE and so fires no signals. Like queue_post_approval_actions(),
+    the tasks are only queued once the approval is committed, and run on
+    a thread pool when Celery runs tasks eagerly.
+    
+    Args:
+        article_ids: Primary keys of the approved Articles
+    """
+    article_ids = list(article_ids)
+    if not article_ids:
+        return
+    
+    def enqueue():
+        if getattr(settings, 'CELERY_TASK_ALWAYS_EAGER', False):
+            run_bulk_post_approval_actions(article_ids)
+        else:
+            send_article_emails.delay(article_ids)
+            post_articles_to_twitter.delay(article_ids)
+    
+    transaction.on_commit(enqueue)
 
 
 def send_email_to_subscribers(article):
@@ -110,66 +287,72 @@ def send_email_to_subscribers(article):
     Raises:
         Exception: If email sending fails
     """
+    if getattr(settings, 'NEWS_DISABLE_SIDE_EFFECTS', False):
+        logger.debug(f"Side effects disabled; not emailing about '{article.title}'")
+        return
+    
     try:
-        # Get subscribers based on article type
-        subscribers = get_article_subscribers(article)
-        
-        if not subscribers:
-            logger.info(f"No subscribers found for article '{article.title}'")
-            return
-        
         # Prepare email content
         subject = f"New Article: {article.title}"
         
         # Get source name for the email
         if article.author:
-            source_name = (
-                article.author.get_full_name() or article.author.username
-            )
+            source_name = article.author.display_name
             source_type = "journalist"
         else:
             source_name = article.publisher.name
             source_type = "publisher"
         
-        message = f"""
-Hello,
-
-A new article has been published by {source_name} ({source_type}).
-
-Title: {article.title}
-
-{article.content[:200]}{'...' if len(article.content) > 200 else ''}
-
----
-This is an automated notification from Dispatch.
-        """.strip()
-        
-        # Get subscriber emails
-        recipient_emails = [sub.email for sub in subscribers if sub.email]
+        preview = article.content[:EMAIL_PREVIEW_LENGTH]
+        if len(article.content) > EMAIL_PREVIEW_LENGTH:
+            preview += '...'
+        message = EMAIL_MESSAGE_TEMPLATE.format(
+            source_name=source_name,
+            source_type=source_type,
+            title=article.title,
+            preview=preview,
+        )
         
-        if not recipient_emails:
-            logger.warning(
-                f"No valid email addresses found for subscribers "
-                f"of article '{article.title}'"
+        # Stream subscriber addresses in batches instead of loading
+        # whole user rows
+        emails = get_subscriber_emails(article).iterator(
+            chunk_size=EMAIL_BATCH_SIZE
+        )
+        batch = list(islice(emails, EMAIL_BATCH_SIZE))
+        if not batch:
+            logger.info(
+                f"No subscribers with an email address "
+                f"for article '{article.title}'"
             )
             return
         
-        # Send email
+        from_email = (
+            settings.DEFAULT_FROM_EMAIL
+            if hasattr(settings, 'DEFAULT_FROM_EMAIL')
+            else 'noreply@newsapp.com'
+        )
+        
+        # Send one message per subscriber, so addresses aren't disclosed
+        # to each other, over a single connection in batches
         # In development, this will print to console
         # In production, configure SMTP settings in settings.py
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=(
-                settings.DEFAULT_FROM_EMAIL
-                if hasattr(settings, 'DEFAULT_FROM_EMAIL')
-                else 'noreply@newsapp.com'
-            ),
-            recipient_list=recipient_emails,
-            fail_silently=False,
-        )
+        sent = 0
+        with get_connection(fail_silently=False) as connection:
+            while batch:
+                connection.send_messages([
+                    EmailMessage(
+                        subject=subject,
+                        body=message,
+                        from_email=from_email,
+                        to=[email],
+                        connection=connection,
+                    )
+                    for email in batch
+                ])
+                sent += len(batch)
+                batch = list(islice(emails, EMAIL_BATCH_SIZE))
         
-        logger.info(f"Sent email notification to {len(recipient_emails)} subscribers for article '{article.title}'")
+        logger.info(f"Sent email notification to {sent} subscribers for article '{article.title}'")
         
     except Exception as e:
         logger.error(f"Failed to send email for article '{article.title}': {str(e)}")
@@ -189,24 +372,92 @@ def get_article_subscribers(article):
     subscribers = CustomUser.objects.none()
     
     try:
-        if article.is_independent:
+        # Filter on the raw IDs, so the author/publisher rows aren't loaded
+        readers = CustomUser.objects.filter(role=CustomUser.READER, is_active=True)
+        if article.author_id is not None:
             # Get subscribers of the journalist
-            subscribers = article.author.journalist_subscribers.filter(
-                role=CustomUser.READER,
-                is_active=True
-            )
-        elif article.is_publisher_content:
+            subscribers = readers.filter(subscribed_journalists=article.author_id)
+        elif article.publisher_id is not None:
             # Get subscribers of the publisher
-            subscribers = article.publisher.subscribers.filter(
-                role=CustomUser.READER,
-                is_active=True
-            )
+            subscribers = readers.filter(subscribed_publishers=article.publisher_id)
     except Exception as e:
         logger.error(f"Error getting subscribers for article '{article.title}': {str(e)}")
     
     return subscribers
 
 
+def get_subscriber_emails(article):
+    """
+    Get the email addresses of an article's subscribers.
+    
+    Args:
+        article: The Article instance
+    
+    Returns:
+        Flat values_list QuerySet of non-empty email addresses
+    """
+    return get_article_subscribers(article).exclude(
+        email=''
+    ).values_list('email', flat=True)
+
+
+@lru_cache(maxsize=1)
+def get_twitter_credentials():
+    """
+    Get the configured Twitter/X credentials.
+    
+    Resolved once per process; the cache is reset when one of the
+    settings changes (e.g. override_settings in tests).
+    
+    Returns:
+        Tuple of (api_key, api_secret, access_token, access_token_secret),
+        or None if any of them is missing or still a placeholder
+    """
+    credentials = tuple(
+        getattr(settings, name, None) for name in TWITTER_CREDENTIAL_PLACEHOLDERS
+    )
+    for value, placeholder in zip(credentials, TWITTER_CREDENTIAL_PLACEHOLDERS.values()):
+        if not value or value == placeholder:
+            return None
+    return credentials
+
+
+@receiver(setting_changed)
+def reset_twitter_credentials(sender, setting, **kwargs):
+    """Forget resolved Twitter/X credentials when one of their settings changes."""
+    if setting in TWITTER_CREDENTIAL_PLACEHOLDERS:
+        get_twitter_credentials.cache_clear()
+
+
+# Each thread's OAuth1 session and the credentials it was built with
+_twitter_sessions = threading.local()
+
+
+def _twitter_session(api_key, api_secret, access_token, access_token_secret):
+    """
+    Get this thread's OAuth1 session for posting to Twitter/X.
+    
+    The session is kept so its connection pool keeps the TLS connection
+    to the API alive between posts. requests sessions aren't documented
+    as thread-safe, so request threads and the post-approval pool each
+    get their own. Changed credentials get a new session.
+    """
+    credentials = (api_key, api_secret, access_token, access_token_secret)
+    if getattr(_twitter_sessions, 'credentials', None) != credentials:
+        # Import OAuth1Session for proper authentication
+        from requests_oauthlib import OAuth1Session
+        
+        # Create OAuth1 session with consumer and access credentials
+        _twitter_sessions.session = OAuth1Session(
+            api_key,
+            client_secret=api_secret,
+            resource_owner_key=access_token,
+            resource_owner_secret=access_token_secret,
+        )
+        _twitter_sessions.credentials = credentials
+    return _twitter_sessions.session
+
+
 def post_to_twitter(article):
     """
     Post approved article to Twitter/X using the API with OAuth 1.0a.
@@ -221,23 +472,18 @@ def post_to_twitter(article):
     Raises:
         Exception: If Twitter API call fails
     """
+    if getattr(settings, 'NEWS_DISABLE_SIDE_EFFECTS', False):
+        logger.debug(f"Side effects disabled; not posting '{article.title}'")
+        return
+    
     try:
-        # Check if Twitter credentials are configured
-        if not all([
-            hasattr(settings, 'TWITTER_API_KEY'),
-            hasattr(settings, 'TWITTER_API_SECRET'),
-            hasattr(settings, 'TWITTER_ACCESS_TOKEN'),
-            hasattr(settings, 'TWITTER_ACCESS_TOKEN_SECRET')
-        ]):
-            logger.warning("Twitter API credentials not configured. Skipping Twitter post.")
-            return
-        
-        # Check if credentials are placeholder values
-        if (settings.TWITTER_API_KEY == 'your-twitter-api-key' or
-            settings.TWITTER_API_SECRET == 'your-twitter-api-secret' or
-            settings.TWITTER_ACCESS_TOKEN == 'your-access-token' or
-            settings.TWITTER_ACCESS_TOKEN_SECRET == 'your-access-token-secret'):
-            logger.warning("Twitter API credentials are placeholder values. Skipping Twitter post.")
+        # Check if Twitter credentials are configured (and not placeholders)
+        credentials = get_twitter_credentials()
+        if credentials is None:
+            logger.warning(
+                "Twitter API credentials are not configured or are placeholder "
+                "values. Skipping Twitter post."
+            )
             return
         
         # Prepare tweet content
@@ -246,7 +492,7 @@ def post_to_twitter(article):
         
         # Get source name
         if article.author:
-            source_name = article.author.get_full_name() or article.author.username
+            source_name = article.author.display_name
         else:
             source_name = article.publisher.name
         
@@ -259,19 +505,8 @@ def post_to_twitter(article):
             content_preview = article.content[:remaining_chars - 3] + "..."
             tweet_text += content_preview
         
-        # Twitter API v2 endpoint for creating tweets
-        url = "https://api.twitter.com/2/tweets"
-        
-        # Import OAuth1Session for proper authentication
-        from requests_oauthlib import OAuth1Session
-        
-        # Create OAuth1 session with consumer and access credentials
-        twitter = OAuth1Session(
-            settings.TWITTER_API_KEY,
-            client_secret=settings.TWITTER_API_SECRET,
-            resource_owner_key=settings.TWITTER_ACCESS_TOKEN,
-            resource_owner_secret=settings.TWITTER_ACCESS_TOKEN_SECRET,
-        )
+        # Reuse the OAuth1 session (and its open connection) across posts
+        twitter = _twitter_session(*credentials)
         
         # Prepare payload
         payload = {
@@ -279,7 +514,7 @@ def post_to_twitter(article):
         }
         
         # Make POST request to Twitter API with OAuth 1.0a authentication
-        response = twitter.post(url, json=payload, timeout=10)
+        response = twitter.post(TWITTER_TWEETS_URL, json=payload, timeout=10)
         
         # Check response
         if response.status_code == 201:
@@ -0,0 +1,233 @@
+"""
+Celery Tasks for News Application
+
+This module contains background tasks so that slow network calls
+(email delivery and Twitter/X posting) run outside the request cycle.
+Each action is its own task, so a failing Twitter post doesn't hold up
+or repeat the subscriber emails. Without a worker (CELERY_TASK_ALWAYS_EAGER)
+the actions run on a thread pool in the web process instead.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from celery import shared_task
+from django.db import close_old_connections
+import logging
+
+from .models import Article
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _post_approval_pool():
+    """
+    Get the thread pool that runs post-approval actions without a worker.
+    
+    Created on first use, so Celery workers, management commands and
+    test runs that never take the eager path don't start its threads.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='post-approval')
+
+
+def _load_article(article_id):
+    """
+    Load an approved article with the rows the notifications read.
+    
+    Args:
+        article_id: Primary key of the Article
+    
+    Returns:
+        The Article, or None if it no longer exists
+    """
+    try:
+        return Article.objects.select_related(
+            'author', 'publisher'
+        ).get(pk=article_id)
+    except Article.DoesNotExist:
+        logger.warning(
+            f"Article {article_id} no longer exists. "
+            "Skipping post-approval action."
+        )
+        return None
+
+
+def _iter_articles(article_ids):
+    """
+    Stream approved articles with the rows the notifications read.
+    
+    Args:
+        article_ids: Primary keys of the Articles
+    
+    Returns:
+        Iterator over the Articles that still exist
+    """
+    return Article.objects.select_related(
+        'author', 'publisher'
+    ).filter(pk__in=article_ids).iterator()
+
+
+def _run_batch(action, article_ids, description):
+    """
+    Run a post-approval action for each article in a batch.
+    
+    Failures are logged and the batch carries on, then the batch is
+    failed as a whole, so Celery records the task as failed rather than
+    successful.
+    
+    Args:
+        action: Function taking an Article, e.g. post_to_twitter
+        article_ids: Primary keys of the approved Articles
+        description: What the action does, for log and error messages
+    
+    Raises:
+        RuntimeError: If the action failed for any article
+    """
+    failed_ids = []
+    for article in _iter_articles(article_ids):
+        try:
+            action(article)
+        except Exception:
+            logger.exception(f"{description} failed for article {article.pk}")
+            failed_ids.append(article.pk)
+    
+    if failed_ids:
+        raise RuntimeError(
+            f"{description} failed for {len(failed_ids)} of "
+            f"{len(article_ids)} articles: {failed_ids}"
+        )
+
+
+@shared_task
+def send_article_email(article_id):
+    """
+    Email the subscribers of an approved article's source.
+    
+    Args:
+        article_id: Primary key of the approved Article
+    """
+    # Imported here because signals.py imports this module
+    from .signals import send_email_to_subscribers
+    
+    article = _load_article(article_id)
+    if article is not None:
+        send_email_to_subscribers(article)
+
+
+@shared_task
+def post_article_to_twitter(article_id):
+    """
+    Post an approved article to Twitter/X.
+    
+    Args:
+        article_id: Primary key of the approved Article
+    """
+    # Imported here because signals.py imports this module
+    from .signals import post_to_twitter
+    
+    article = _load_article(article_id)
+    if article is not None:
+        post_to_twitter(article)
+
+
+@shared_task
+def send_article_emails(article_ids):
+    """
+    Email subscribers for a batch of approved articles.
+    
+    A failure for one article doesn't stop the rest; the task fails once
+    the batch is done (see _run_batch).
+    
+    Args:
+        article_ids: Primary keys of the approved Articles
+    """
+    # Imported here because signals.py imports this module
+    from .signals import send_email_to_subscribers
+    
+    _run_batch(send_email_to_subscribers, article_ids, 'Emailing subscribers')
+
+
+@shared_task
+def post_articles_to_twitter(article_ids):
+    """
+    Post a batch of approved articles to Twitter/X.
+    
+    A failure for one article doesn't stop the rest; the task fails once
+    the batch is done (see _run_batch).
+    
+    Args:
+        article_ids: Primary keys of the approved Articles
+    """
+    # Imported here because signals.py imports this module
+    from .signals import post_to_twitter
+    
+    _run_batch(post_to_twitter, article_ids, 'Posting to Twitter/X')
+
+
+def _run_in_background(description, action, *args):
+    """
+    Run one post-approval action on a pool thread, logging any failure.
+    
+    Pool threads keep their own database connections between actions, so
+    stale ones are dropped before and after each action, as Django does
+    around each request.
+    
+    Args:
+        description: What the action does, for the log message
+        action: Function to call
+        *args: Arguments for the action
+    """
+    close_old_connections()
+    try:
+        action(*args)
+    except Exception:
+        # Nothing waits on the result; the article stays approved
+        logger.exception(f"{description} failed for {args[0]!r}")
+    finally:
+        close_old_connections()
+
+
+def run_post_approval_actions(article_id):
+    """
+    Hand both post-approval actions for an article to the thread pool.
+    
+    Used when Celery runs tasks eagerly (no worker). The emails and the
+    Twitter/X post run side by side on pool threads, so the approving
+    request returns without waiting on SMTP or the Twitter/X API. The
+    article and its author/publisher are loaded here first.
+    
+    Args:
+        article_id: Primary key of the approved Article
+    """
+    # Imported here because signals.py imports this module
+    from .signals import post_to_twitter, send_email_to_subscribers
+    
+    article = _load_article(article_id)
+    if article is None:
+        return
+    
+    pool = _post_approval_pool()
+    pool.submit(
+        _run_in_background, 'Emailing subscribers', send_email_to_subscribers, article
+    )
+    pool.submit(_run_in_background, 'Posting to Twitter/X', post_to_twitter, article)
+
+
+def run_bulk_post_approval_actions(article_ids):
+    """
+    Hand both batch post-approval tasks to the thread pool.
+    
+    The eager counterpart of queuing send_article_emails and
+    post_articles_to_twitter, which run here as plain function calls.
+    
+    Args:
+        article_ids: Primary keys of the approved Articles
+    """
+    pool = _post_approval_pool()
+    pool.submit(
+        _run_in_background, 'Emailing subscribers', send_article_emails, article_ids
+    )
+    pool.submit(
+        _run_in_background, 'Posting to Twitter/X', post_articles_to_twitter, article_ids
+    )
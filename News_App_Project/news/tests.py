@@ -4,151 +4,273 @@ Comprehensive Unit Tests for News Application API
 Tests cover: authentication, authorization, CRUD operations, subscriptions, and signals.
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth import get_user_model
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import (
+    APIClient, APIRequestFactory, APITestCase, force_authenticate
+)
 from rest_framework import status
-from unittest.mock import patch
-from django.core import mail
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.tokens import AccessToken
+from unittest.mock import MagicMock, patch
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.urls import reverse
 
+from news import signals, tasks
+from news.api_views import ArticleViewSet
 from news.models import Article, Newsletter, Publisher, CustomUser
 
 User = get_user_model()
 
+# Password hashing isn't under test here; skip the slow default hasher
+FAST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
 
-class ModelTestCase(TestCase):
-    """Test model validation and methods."""
+# make_password('pass') under FAST_PASSWORD_HASHERS, so fixtures store a
+# ready-made hash instead of hashing per user. The salt is as long as a
+# generated one; a shorter salt makes every login re-hash and save it.
+HASHED_PASSWORD = 'md5$newsFixturePassword123$64ec5a3ca1177919175cd5921dc24e85'
+
+READER, JOURNALIST, EDITOR = CustomUser.READER, CustomUser.JOURNALIST, CustomUser.EDITOR
+
+# Bound once at import; the article tests call these views directly
+ARTICLE_LIST_VIEW = ArticleViewSet.as_view({'get': 'list'})
+ARTICLE_CREATE_VIEW = ArticleViewSet.as_view({'post': 'create'})
+ARTICLE_APPROVE_VIEW = ArticleViewSet.as_view({'post': 'approve'})
+
+
+def seed_articles(specs):
+    """
+    Insert articles with a single query, without sending model signals.
     
-    def setUp(self):
-        self.reader = User.objects.create_user(username='reader', password='pass', role=CustomUser.READER)
-        self.journalist = User.objects.create_user(username='journalist', password='pass', role=CustomUser.JOURNALIST)
-        self.publisher = Publisher.objects.create(name='Test Publisher')
+    For fixtures only; tests of the approval signals save articles
+    normally. bulk_create() skips Article.save(), so source_display is
+    filled in here.
+    
+    Args:
+        specs: Iterable of Article field dicts
     
-    def test_article_validation_both_author_and_publisher(self):
+    Returns:
+        The saved articles, in the order given
+    """
+    articles = [Article(**spec) for spec in specs]
+    for article in articles:
+        article.refresh_source_display()
+    return Article.objects.bulk_create(articles)
+
+
+class RecordingEmailBackend(BaseEmailBackend):
+    """
+    Email backend that records each message's subject and recipients.
+    
+    Unlike the locmem backend, messages are never rendered to MIME, which
+    is all the tests here need.
+    """
+    
+    sent = []
+    
+    def send_messages(self, email_messages):
+        self.sent.extend((message.subject, message.to) for message in email_messages)
+        return len(email_messages)
+
+
+class ArticleModelTestCase(SimpleTestCase):
+    """
+    Test article rules that only read the instance.
+    
+    SimpleTestCase refuses database access, so these stay query-free.
+    """
+    
+    def test_model_article_validation_both_author_and_publisher(self):
         """Article cannot have both author and publisher."""
-        article = Article(title='Test', content='Content', author=self.journalist, publisher=self.publisher)
-        with self.assertRaises(Exception):
-            article.save()
+        article = Article(title='Test', content='Content', author_id=1, publisher_id=1)
+        # clean() holds the rule; full_clean() would also query the check constraint
+        with self.assertRaises(ValidationError):
+            article.clean()
     
-    def test_article_independent_property(self):
+    def test_model_article_independent_property(self):
         """Test article independent property."""
-        article = Article.objects.create(title='Test', content='Content', author=self.journalist)
+        article = Article(title='Test', content='Content', author_id=1)
         self.assertTrue(article.is_independent)
         self.assertFalse(article.is_publisher_content)
 
 
-class APIAuthenticationTestCase(APITestCase):
-    """Test API authentication."""
+@override_settings(
+    PASSWORD_HASHERS=FAST_PASSWORD_HASHERS,
+    NEWS_DISABLE_SIDE_EFFECTS=True
+)
+class NewsSuite(APITestCase):
+    """
+    Test authentication, the article API and subscriptions.
+    
+    One class, so the fixtures are built inside a single outer
+    transaction; tests are grouped by their name prefix.
+    """
+    
+    factory = APIRequestFactory()
+    
+    @classmethod
+    def setUpTestData(cls):
+        # One INSERT per model
+        cls.reader, cls.journalist, cls.journalist2, cls.editor = User.objects.bulk_create([
+            User(username=username, password=HASHED_PASSWORD, role=role)
+            for username, role in (
+                ('reader', READER), ('journalist', JOURNALIST), ('j2', JOURNALIST), ('editor', EDITOR)
+            )
+        ])
+        cls.publisher = Publisher.objects.create(name='Test Publisher')
+        cls.reader.subscribed_journalists.add(cls.journalist)
+        
+        (
+            cls.approved_article, cls.pending_article, cls.unsubscribed_article
+        ) = seed_articles([
+            dict(title='Approved', content='Content', author=cls.journalist, approved=True),
+            dict(title='Pending', content='Content', author=cls.journalist, approved=False),
+            dict(title='Unsubscribed', content='C', author=cls.journalist2, approved=True),
+        ])
+        
+        # Signed once; the end-to-end test skips the /api/token/ round trip
+        cls.reader_token = str(AccessToken.for_user(cls.reader))
+        
+        # Resolve the endpoints the client tests request once per class
+        cls.list_url = reverse('article-list')
+        cls.subscribed_url = reverse('article-subscribed')
     
     def setUp(self):
-        self.user = User.objects.create_user(username='user', password='pass', role=CustomUser.READER)
+        # Subscription IDs are cached; start every test from the database
+        cache.clear()
     
-    def test_api_requires_authentication(self):
+    def _call(self, view, user, data=None, **kwargs):
+        """Call a pre-bound view directly, without routing or middleware."""
+        # The first method the view was bound with (GET views also answer HEAD)
+        method = next(iter(view.actions))
+        request = getattr(self.factory, method)('/', data, format='json')
+        force_authenticate(request, user=user)
+        return view(request, **kwargs)
+    
+    # ===== AUTHENTICATION =====
+    
+    def test_auth_api_requires_authentication(self):
         """API endpoints require authentication."""
-        response = self.client.get('/api/articles/')
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     
-    def test_jwt_token_obtain(self):
+    def test_auth_jwt_token_obtain(self):
         """Test obtaining JWT token."""
-        response = self.client.post('/api/token/', {'username': 'user', 'password': 'pass'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('access', response.data)
-
-
-class ArticleAPITestCase(APITestCase):
-    """Test Article API endpoints."""
+        # The /api/token/ endpoint itself is covered in test_comprehensive
+        serializer = TokenObtainPairSerializer(data={'username': 'reader', 'password': 'pass'})
+        # Only the user lookup: with UPDATE_LAST_LOGIN off, issuing a token
+        # sends no user_logged_in signal and writes no last_login
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid())
+        self.assertIn('access', serializer.validated_data)
     
-    def setUp(self):
-        self.reader = User.objects.create_user(username='reader', password='pass', role=CustomUser.READER)
-        self.journalist = User.objects.create_user(username='journalist', password='pass', role=CustomUser.JOURNALIST)
-        self.editor = User.objects.create_user(username='editor', password='pass', role=CustomUser.EDITOR)
-        
-        self.approved_article = Article.objects.create(
-            title='Approved', content='Content', author=self.journalist, approved=True
-        )
-        self.pending_article = Article.objects.create(
-            title='Pending', content='Content', author=self.journalist, approved=False
-        )
+    # ===== ARTICLE API =====
     
-    def _auth(self, user):
-        """Helper to authenticate."""
-        response = self.client.post('/api/token/', {'username': user.username, 'password': 'pass'})
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data["access"]}')
-    
-    def test_reader_sees_only_approved(self):
+    def test_article_reader_sees_only_approved(self):
         """Readers see only approved articles."""
-        self._auth(self.reader)
-        response = self.client.get('/api/articles/')
+        # The page count and the page itself
+        with self.assertNumQueries(2):
+            response = self._call(ARTICLE_LIST_VIEW, self.reader)
         ids = [a['id'] for a in response.data['results']]
         self.assertIn(self.approved_article.id, ids)
         self.assertNotIn(self.pending_article.id, ids)
+        
+        # More articles from other sources mustn't add queries per article
+        seed_articles(
+            dict(
+                title=f'Extra {i}', content='Content', publisher=self.publisher,
+                approved=True, approved_by=self.editor
+            )
+            for i in range(5)
+        )
+        with self.assertNumQueries(2):
+            self._call(ARTICLE_LIST_VIEW, self.reader)
     
-    def test_journalist_can_create(self):
+    def test_article_journalist_can_create(self):
         """Journalists can create articles."""
-        self._auth(self.journalist)
-        response = self.client.post('/api/articles/', {
+        response = self._call(ARTICLE_CREATE_VIEW, self.journalist, {
             'title': 'New', 'content': 'Content', 'author': self.journalist.id
         })
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
     
-    def test_reader_cannot_create(self):
+    def test_article_reader_cannot_create(self):
         """Readers cannot create articles."""
-        self._auth(self.reader)
-        response = self.client.post('/api/articles/', {'title': 'New', 'content': 'Content'})
+        response = self._call(ARTICLE_CREATE_VIEW, self.reader, {'title': 'New', 'content': 'Content'})
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
     
-    def test_editor_can_approve(self):
+    def test_article_editor_can_approve(self):
         """Editors can approve articles."""
-        self._auth(self.editor)
-        with patch('news.signals.send_email_to_subscribers'), patch('news.signals.post_to_twitter'):
-            response = self.client.post(f'/api/articles/{self.pending_article.id}/approve/')
-            self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.pending_article.refresh_from_db()
-            self.assertTrue(self.pending_article.approved)
-
-
-class SubscriptionFilterTestCase(APITestCase):
-    """Test subscription-based filtering."""
+        response = self._call(ARTICLE_APPROVE_VIEW, self.editor, pk=self.pending_article.pk)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.pending_article.refresh_from_db()
+        self.assertTrue(self.pending_article.approved)
     
-    def setUp(self):
-        self.reader = User.objects.create_user(username='reader', password='pass', role=CustomUser.READER)
-        self.journalist1 = User.objects.create_user(username='j1', password='pass', role=CustomUser.JOURNALIST)
-        self.journalist2 = User.objects.create_user(username='j2', password='pass', role=CustomUser.JOURNALIST)
-        
-        self.reader.subscribed_journalists.add(self.journalist1)
-        
-        self.article1 = Article.objects.create(title='A1', content='C', author=self.journalist1, approved=True)
-        self.article2 = Article.objects.create(title='A2', content='C', author=self.journalist2, approved=True)
+    # ===== SUBSCRIPTIONS =====
     
-    def test_subscribed_endpoint(self):
+    def test_subscription_subscribed_endpoint(self):
         """Subscribed endpoint returns only subscribed articles."""
-        response = self.client.post('/api/token/', {'username': 'reader', 'password': 'pass'})
-        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data["access"]}')
+        # End to end, through the URL conf, middleware and JWT authentication
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.reader_token}')
         
-        response = self.client.get('/api/articles/subscribed/')
+        # The token's user, both subscription ID lists, the count and the page
+        with self.assertNumQueries(5):
+            response = self.client.get(self.subscribed_url)
         ids = [a['id'] for a in response.data['results']]
-        self.assertIn(self.article1.id, ids)
-        self.assertNotIn(self.article2.id, ids)
+        self.assertIn(self.approved_article.id, ids)
+        self.assertNotIn(self.unsubscribed_article.id, ids)
+        
+        # Cached subscription IDs, and no queries per subscribed article
+        seed_articles(
+            dict(title=f'Extra {i}', content='C', author=self.journalist, approved=True)
+            for i in range(5)
+        )
+        with self.assertNumQueries(3):
+            self.client.get(self.subscribed_url)
 
 
+@override_settings(
+    PASSWORD_HASHERS=FAST_PASSWORD_HASHERS,
+    EMAIL_BACKEND='news.tests.RecordingEmailBackend',
+    NEWS_DISABLE_SIDE_EFFECTS=False
+)
 class SignalTestCase(TestCase):
     """Test signal functionality."""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor, cls.journalist, cls.reader = User.objects.bulk_create([
+            User(username=username, password=HASHED_PASSWORD, email=f'{username}@test.com', role=role)
+            for username, role in (('editor', EDITOR), ('j', JOURNALIST), ('r', READER))
+        ])
+        cls.reader.subscribed_journalists.add(cls.journalist)
+    
     def setUp(self):
-        self.editor = User.objects.create_user(username='editor', password='pass', email='e@test.com', role=CustomUser.EDITOR)
-        self.journalist = User.objects.create_user(username='j', password='pass', email='j@test.com', role=CustomUser.JOURNALIST)
-        self.reader = User.objects.create_user(username='r', password='pass', email='r@test.com', role=CustomUser.READER)
-        self.reader.subscribed_journalists.add(self.journalist)
+        RecordingEmailBackend.sent = []
+        # Run the eager post-approval actions on this thread, so they see
+        # the test's rows; the pool threads' connection cleanup is skipped
+        pool = MagicMock()
+        pool.submit.side_effect = lambda fn, *args: fn(*args)
+        for patcher in (
+            patch.object(tasks, '_post_approval_pool', return_value=pool),
+            patch.object(tasks, 'close_old_connections'),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
     
     def test_approval_sends_email(self):
         """Approving article sends email to subscribers."""
         article = Article.objects.create(title='Test', content='Content', author=self.journalist)
         
-        with patch('news.signals.post_to_twitter'):
+        with patch.object(signals, 'post_to_twitter'), \
+             self.captureOnCommitCallbacks(execute=True):
             article.approved = True
             article.approved_by = self.editor
             article.save()
         
-        self.assertEqual(len(mail.outbox), 1)
-        self.assertIn('Test', mail.outbox[0].subject)
+        self.assertEqual(len(RecordingEmailBackend.sent), 1)
+        subject, to = RecordingEmailBackend.sent[0]
+        self.assertIn('Test', subject)
+        self.assertEqual(to, ['r@test.com'])
 
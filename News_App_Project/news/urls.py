@@ -2,39 +2,49 @@
 URL Configuration for News Application
 
 Maps URLs to views for landing page, registration, article approval, listing, and newsletters.
+
+Routes sharing a prefix are grouped with include(), so the resolver
+checks each prefix once instead of every route under it.
 """
 
-from django.urls import path
+from django.urls import include, path
 from . import views
 
+article_patterns = [
+    path('', views.article_list, name='article_list'),
+    path('create/', views.create_article, name='create_article'),
+    path('<int:article_id>/', views.article_detail, name='article_detail'),
+    
+    # Article Approval URLs (Editors only)
+    path('<int:article_id>/approve/', views.approve_article, name='approve_article'),
+    path('<int:article_id>/reject/', views.reject_article, name='reject_article'),
+    path('approve/', views.bulk_approve_articles, name='bulk_approve_articles'),
+]
+
+newsletter_patterns = [
+    path('', views.newsletter_list, name='newsletter_list'),
+    path('create/', views.create_newsletter, name='create_newsletter'),
+    path('<int:newsletter_id>/', views.newsletter_detail, name='newsletter_detail'),
+]
+
+# Subscription URLs (Readers only)
+subscribe_patterns = [
+    path('publisher/<int:publisher_id>/', views.toggle_publisher_subscription, name='toggle_publisher_subscription'),
+    path('journalist/<int:journalist_id>/', views.toggle_journalist_subscription, name='toggle_journalist_subscription'),
+]
+
 urlpatterns = [
-    # Public pages
-    path('', views.landing, name='landing'),
-    path('register/', views.register, name='register'),
+    path('articles/', include(article_patterns)),
+    path('newsletters/', include(newsletter_patterns)),
+    path('subscribe/', include(subscribe_patterns)),
     
     # Dashboard (authenticated users)
     path('dashboard/', views.dashboard, name='dashboard'),
-    
-    # Article URLs
-    path('articles/', views.article_list, name='article_list'),
-    path('articles/<int:article_id>/', views.article_detail, name='article_detail'),
-    path('articles/create/', views.create_article, name='create_article'),
-    
-    # Article Approval URLs (Editors only)
     path('pending/', views.pending_articles, name='pending_articles'),
-    path('articles/<int:article_id>/approve/', views.approve_article, name='approve_article'),
-    path('articles/<int:article_id>/reject/', views.reject_article, name='reject_article'),
-    
-    # Newsletter URLs
-    path('newsletters/', views.newsletter_list, name='newsletter_list'),
-    path('newsletters/<int:newsletter_id>/', views.newsletter_detail, name='newsletter_detail'),
-    path('newsletters/create/', views.create_newsletter, name='create_newsletter'),
-    
-    # Subscription URLs (Readers only)
     path('subscriptions/', views.browse_subscriptions, name='browse_subscriptions'),
-    path('subscribe/publisher/<int:publisher_id>/', views.toggle_publisher_subscription, name='toggle_publisher_subscription'),
-    path('subscribe/journalist/<int:journalist_id>/', views.toggle_journalist_subscription, name='toggle_journalist_subscription'),
     
-    # Utility URLs
+    # Public pages
+    path('register/', views.register, name='register'),
     path('access-denied/', views.access_denied, name='access_denied'),
+    path('', views.landing, name='landing'),
 ]
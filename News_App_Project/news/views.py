@@ -10,16 +10,41 @@ This module contains view functions for:
 - Role-based access control
 """
 
+from datetime import datetime
+from functools import wraps
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth import login
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
 from django.utils import timezone
-from django.db.models import Q
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import require_POST
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import Prefetch, Q
+from django.db.models.functions import Left
 from django import forms
 
-from .models import Article, Newsletter, Publisher, CustomUser
+from .models import (
+    Article,
+    Newsletter,
+    Publisher,
+    CustomUser,
+    pending_article_count
+)
+from .pagination import EstimatedCountPaginator
+from .signals import queue_bulk_post_approval_actions, queue_post_approval_actions
+
+# Rows per page on the article and newsletter list pages
+LIST_PAGE_SIZE = 25
+
+# Characters of content loaded for the list pages' previews; comfortably
+# more than the 50 words the longest preview shows
+PREVIEW_LENGTH = 1000
+
+# The article columns the list pages show, besides the preview
+LIST_FIELDS = ('id', 'title', 'source_display', 'created_at', 'approved')
 
 
 # ===== FORMS =====
@@ -49,6 +74,11 @@ class ArticleCreateForm(forms.ModelForm):
             'content': 'Write the full content of your article.',
             'publisher': 'Optional: Select a publisher if this article is for a specific organization.',
         }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The dropdown only shows names; skip the descriptions
+        self.fields['publisher'].queryset = Publisher.objects.only('id', 'name').order_by('name')
 
 
 class NewsletterCreateForm(forms.ModelForm):
@@ -79,11 +109,12 @@ class NewsletterCreateForm(forms.ModelForm):
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         if user and user.is_journalist:
-            # Only show approved articles by this journalist
+            # Only show approved articles by this journalist; the checkboxes
+            # are labelled with titles, so leave the content unread
             self.fields['articles'].queryset = Article.objects.filter(
                 author=user,
                 approved=True
-            )
+            ).only('id', 'title').order_by('-created_at')
 
 
 class UserRegistrationForm(forms.ModelForm):
@@ -124,6 +155,14 @@ class UserRegistrationForm(forms.ModelForm):
             raise forms.ValidationError("Passwords don't match")
         return password_confirm
     
+    def validate_unique(self):
+        """
+        Skip the pre-save query for a taken username.
+        
+        The unique constraint is checked by the INSERT itself; register()
+        reports a conflict as a form error.
+        """
+    
     def save(self, commit=True):
         """Save user with hashed password."""
         user = super().save(commit=False)
@@ -149,6 +188,23 @@ def landing(request):
     if request.user.is_authenticated:
         return redirect('dashboard')
     
+    return anonymous_landing(request)
+
+
+@cache_page(60 * 60)
+def anonymous_landing(request):
+    """
+    Render the landing page, cached for an hour.
+    
+    The page is identical for every anonymous visitor, so it is only
+    cached after landing() has redirected authenticated users.
+    
+    Args:
+        request: HTTP request object
+    
+    Returns:
+        Rendered landing page template
+    """
     return render(request, 'news/landing.html')
 
 
@@ -168,13 +224,21 @@ def register(request):
     if request.method == 'POST':
         form = UserRegistrationForm(request.POST)
         if form.is_valid():
-            user = form.save()
-            login(request, user)
-            messages.success(
-                request,
-                f'Welcome {user.username}! Your account has been created successfully.'
-            )
-            return redirect('dashboard')
+            try:
+                with transaction.atomic():
+                    user = form.save()
+            except IntegrityError:
+                form.add_error(
+                    'username',
+                    CustomUser._meta.get_field('username').error_messages['unique']
+                )
+            else:
+                login(request, user)
+                messages.success(
+                    request,
+                    f'Welcome {user.username}! Your account has been created successfully.'
+                )
+                return redirect('dashboard')
     else:
         form = UserRegistrationForm()
     
@@ -219,7 +283,108 @@ def is_editor_or_journalist(user):
     Returns:
         Boolean indicating if user is an editor or journalist
     """
-    return user.is_authenticated and user.role in [CustomUser.EDITOR, CustomUser.JOURNALIST]
+    return user.is_authenticated and user.role in (CustomUser.EDITOR, CustomUser.JOURNALIST)
+
+
+def with_preview(articles):
+    """
+    Load just what the list pages show of each article.
+    
+    That is LIST_FIELDS plus the start of the content: pages only show a
+    truncated preview, so `content_preview` is annotated instead.
+    
+    Args:
+        articles: Article QuerySet
+    
+    Returns:
+        QuerySet limited to LIST_FIELDS, with `content_preview` annotated
+    """
+    return articles.only(*LIST_FIELDS).annotate(content_preview=Left('content', PREVIEW_LENGTH))
+
+
+def with_article(*related, fields=None):
+    """
+    Load the article named by a view's article_id before calling it.
+    
+    The article is attached as request.article, with the given relations
+    joined in the same query; a missing article is a 404. Apply it below
+    the access decorators, so unauthorized requests never load it.
+    
+    Args:
+        *related: Relations to join with select_related()
+        fields: Optional field names to load, instead of every column
+    
+    Returns:
+        View decorator
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, article_id, *args, **kwargs):
+            articles = Article.objects.all()
+            if related:
+                articles = articles.select_related(*related)
+            if fields:
+                articles = articles.only(*fields)
+            request.article = get_object_or_404(articles, pk=article_id)
+            return view(request, article_id, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def paginate(request, queryset):
+    """
+    Get the page of a list view named by the request's ?page= parameter.
+    
+    Out-of-range and malformed page numbers fall back to the nearest
+    valid page, so a stale link never errors.
+    
+    Args:
+        request: HTTP request object
+        queryset: Ordered QuerySet to paginate
+    
+    Returns:
+        Page of at most LIST_PAGE_SIZE objects
+    """
+    paginator = EstimatedCountPaginator(queryset, LIST_PAGE_SIZE)
+    return paginator.get_page(request.GET.get('page'))
+
+
+def keyset_page(request, articles):
+    """
+    Get the page of articles after the ?after=&after_id= cursor.
+    
+    Instead of an OFFSET, each page seeks past the last row of the
+    previous one on (created_at, id), so every page costs the same however
+    deep it is. A missing or malformed cursor gives the first page.
+    
+    Args:
+        request: HTTP request object
+        articles: Article QuerySet, without ordering
+    
+    Returns:
+        Tuple of (list of at most LIST_PAGE_SIZE articles, newest first,
+        cursor dict for the next page or None on the last page)
+    """
+    try:
+        after = datetime.fromisoformat(request.GET['after'])
+        after_id = int(request.GET['after_id'])
+    except (KeyError, ValueError):
+        pass
+    else:
+        if timezone.is_naive(after):
+            after = timezone.make_aware(after)
+        articles = articles.filter(
+            Q(created_at__lt=after) | Q(created_at=after, id__lt=after_id)
+        )
+    
+    # One extra row tells whether there is a next page, without a COUNT
+    rows = list(articles.order_by('-created_at', '-id')[:LIST_PAGE_SIZE + 1])
+    if len(rows) <= LIST_PAGE_SIZE:
+        return rows, None
+    
+    rows = rows[:LIST_PAGE_SIZE]
+    last = rows[-1]
+    return rows, {'after': last.created_at.isoformat(), 'after_id': last.id}
 
 
 # ===== ARTICLE VIEWS =====
@@ -240,23 +405,29 @@ def article_list(request):
         Rendered template with article list
     """
     user = request.user
+    # The template shows each article's stored source_display, so the
+    # author and publisher rows aren't needed
+    articles = with_preview(Article.objects.all())
     
     # Filter articles based on user role
     if user.is_editor:
         # Editors see all articles for review
-        articles = Article.objects.all().order_by('-created_at')
+        articles = articles.order_by('-created_at')
         context_title = "All Articles (Editor View)"
     elif user.is_journalist:
         # Journalists see their own articles
-        articles = Article.objects.filter(author=user).order_by('-created_at')
+        articles = articles.filter(author=user).order_by('-created_at')
         context_title = "My Articles"
     else:  # Reader
         # Readers only see approved articles
-        articles = Article.objects.filter(approved=True).order_by('-created_at')
+        articles = articles.filter(approved=True).order_by('-created_at')
         context_title = "Published Articles"
     
+    page = paginate(request, articles)
+    
     context = {
-        'articles': articles,
+        'articles': page,
+        'page_obj': page,
         'title': context_title,
         'user_role': user.get_role_display(),
     }
@@ -265,6 +436,7 @@ def article_list(request):
 
 
 @login_required
+@with_article('author', 'publisher', 'approved_by')
 def article_detail(request, article_id):
     """
     Display detailed view of a single article.
@@ -279,22 +451,24 @@ def article_detail(request, article_id):
     Raises:
         PermissionDenied: If user doesn't have permission to view the article
     """
-    article = get_object_or_404(Article, pk=article_id)
+    article = request.article
     user = request.user
+    role = user.role
+    is_own_article = article.author_id == user.id
     
     # Check permissions
     # Readers can only view approved articles
-    if user.is_reader and not article.approved:
+    if role == CustomUser.READER and not article.approved:
         raise PermissionDenied("You don't have permission to view this article.")
     
     # Journalists can only view their own unapproved articles or any approved articles
-    if user.is_journalist and not article.approved and article.author != user:
+    if role == CustomUser.JOURNALIST and not article.approved and not is_own_article:
         raise PermissionDenied("You don't have permission to view this article.")
     
     context = {
         'article': article,
-        'can_approve': user.is_editor and not article.approved,
-        'can_edit': user.is_editor or (user.is_journalist and article.author == user),
+        'can_approve': role == CustomUser.EDITOR and not article.approved,
+        'can_edit': role == CustomUser.EDITOR or (role == CustomUser.JOURNALIST and is_own_article),
     }
     
     return render(request, 'news/article_detail.html', context)
@@ -316,11 +490,16 @@ def pending_articles(request):
     Returns:
         Rendered template with pending articles
     """
-    # Get all unapproved articles
-    articles = Article.objects.filter(approved=False).order_by('-created_at')
+    # Get all unapproved articles; the template shows their stored source_display
+    articles = with_preview(Article.objects.filter(approved=False))
+    
+    # The backlog can grow large, so page with a cursor rather than OFFSET
+    articles, next_cursor = keyset_page(request, articles)
     
     context = {
         'articles': articles,
+        'next_cursor': next_cursor,
+        'is_first_page': 'after' not in request.GET,
         'title': 'Pending Articles',
     }
     
@@ -329,6 +508,8 @@ def pending_articles(request):
 
 @login_required
 @user_passes_test(is_editor, login_url='/access-denied/')
+# The title is all the messages need; the approval itself is an UPDATE
+@with_article(fields=('id', 'title'))
 def approve_article(request, article_id):
     """
     Approve an article (editors only).
@@ -336,7 +517,7 @@ def approve_article(request, article_id):
     This view handles the approval workflow:
     1. Validate user is an editor
     2. Update article approval status
-    3. Trigger signals (email + Twitter post)
+    3. Queue the notification tasks (email + Twitter post)
     4. Redirect with success message
     
     Args:
@@ -346,31 +527,32 @@ def approve_article(request, article_id):
     Returns:
         Redirect to pending articles or article detail
     """
-    article = get_object_or_404(Article, pk=article_id)
+    article = request.article
     
     # Double-check user is an editor (defense in depth)
     if not request.user.is_editor:
         raise PermissionDenied("Only editors can approve articles.")
     
-    # Check if article is already approved
-    if article.approved:
-        messages.warning(request, f"Article '{article.title}' is already approved.")
-        return redirect('article_detail', article_id=article.id)
-    
     try:
-        # Approve the article
-        article.approved = True
-        article.approved_by = request.user
-        article.approved_at = timezone.now()
-        article.save()  # This will trigger the post_save signal
+        # approve() locks the row, so two editors can't both approve (and
+        # notify) it, and drops the cached pending count
+        approved_ids = Article.objects.filter(pk=article.pk).approve(request.user)
+        
+        # Check if article is already approved
+        if not approved_ids:
+            messages.warning(request, f"Article '{article.title}' is already approved.")
+            return redirect('article_detail', article_id=article.id)
+        
+        # approve() skips the post_save signals, so queue notifications here
+        queue_post_approval_actions(article.pk)
         
         messages.success(
             request,
             f"Article '{article.title}' has been approved successfully! "
-            f"Notifications have been sent to subscribers."
+            f"Subscribers will be notified shortly."
         )
         
-    except Exception as e:
+    except DatabaseError as e:
         messages.error(
             request,
             f"Error approving article: {str(e)}"
@@ -382,6 +564,8 @@ def approve_article(request, article_id):
 
 @login_required
 @user_passes_test(is_editor, login_url='/access-denied/')
+# Only the title is shown afterwards; deleting needs nothing else
+@with_article(fields=('id', 'title'))
 def reject_article(request, article_id):
     """
     Reject/delete an article (editors only).
@@ -393,7 +577,7 @@ def reject_article(request, article_id):
     Returns:
         Redirect to pending articles list
     """
-    article = get_object_or_404(Article, pk=article_id)
+    article = request.article
     
     # Double-check user is an editor
     if not request.user.is_editor:
@@ -401,14 +585,51 @@ def reject_article(request, article_id):
     
     try:
         article_title = article.title
-        article.delete()
+        article.delete()  # Already runs in its own transaction
         messages.success(request, f"Article '{article_title}' has been rejected and deleted.")
-    except Exception as e:
+    except DatabaseError as e:
         messages.error(request, f"Error rejecting article: {str(e)}")
     
     return redirect('pending_articles')
 
 
+@login_required
+@user_passes_test(is_editor, login_url='/access-denied/')
+@require_POST
+def bulk_approve_articles(request):
+    """
+    Approve the articles selected on the pending list (editors only).
+    
+    All selected articles are approved with a single UPDATE, and their
+    notifications go out as one batched email task and one batched
+    Twitter/X task after commit.
+    
+    Args:
+        request: HTTP request object with the `article_ids` to approve
+    
+    Returns:
+        Redirect to pending articles list
+    """
+    article_ids = [
+        article_id for article_id in request.POST.getlist('article_ids')
+        if article_id.isdigit()
+    ]
+    if not article_ids:
+        messages.warning(request, "Select at least one article to approve.")
+        return redirect('pending_articles')
+    
+    try:
+        # Already-approved articles are skipped, so nothing is notified twice
+        approved_ids = Article.objects.filter(pk__in=article_ids).approve(request.user)
+    except DatabaseError as e:
+        messages.error(request, f"Error approving articles: {str(e)}")
+        return redirect('pending_articles')
+    
+    queue_bulk_post_approval_actions(approved_ids)
+    messages.success(request, f"{len(approved_ids)} article(s) approved successfully!")
+    return redirect('pending_articles')
+
+
 # ===== NEWSLETTER VIEWS =====
 
 @login_required
@@ -422,10 +643,17 @@ def newsletter_list(request):
     Returns:
         Rendered template with newsletter list
     """
-    newsletters = Newsletter.objects.all().order_by('-created_at')
+    # The page shows each newsletter's author and article count, not the
+    # articles themselves
+    newsletters = Newsletter.objects.with_article_count().select_related(
+        'author'
+    ).order_by('-created_at')
+    
+    page = paginate(request, newsletters)
     
     context = {
-        'newsletters': newsletters,
+        'newsletters': page,
+        'page_obj': page,
         'title': 'Newsletters',
     }
     
@@ -444,13 +672,21 @@ def newsletter_detail(request, newsletter_id):
     Returns:
         Rendered template with newsletter details
     """
-    newsletter = get_object_or_404(Newsletter, pk=newsletter_id)
+    # Load the articles in one more query; the template shows their stored
+    # source_display and a preview, so no joins or full content
+    articles = with_preview(Article.objects.all()).order_by('-created_at')
     
     # Get only approved articles for readers
     if request.user.is_reader:
-        articles = newsletter.get_approved_articles()
-    else:
-        articles = newsletter.articles.all()
+        articles = articles.filter(approved=True)
+    
+    newsletter = get_object_or_404(
+        Newsletter.objects.select_related('author').prefetch_related(
+            Prefetch('articles', queryset=articles, to_attr='listed_articles')
+        ),
+        pk=newsletter_id
+    )
+    articles = newsletter.listed_articles
     
     context = {
         'newsletter': newsletter,
@@ -491,18 +727,32 @@ def dashboard(request):
         'user': user,
     }
     
-    # Add role-specific context
+    # Add role-specific context; the article lists only show title and status
     if user.is_editor:
-        context['pending_count'] = Article.objects.filter(approved=False).count()
-        context['recent_articles'] = Article.objects.all().order_by('-created_at')[:5]
+        # A separate COUNT is answered from the (approved, -created_at)
+        # index alone, and is cached briefly between dashboard loads
+        context['pending_count'] = pending_article_count()
+        context['recent_articles'] = Article.objects.only(
+            'id', 'title', 'approved'
+        ).order_by('-created_at')[:5]
     elif user.is_journalist:
-        context['my_articles'] = Article.objects.filter(author=user).order_by('-created_at')[:5]
-        context['my_newsletters'] = Newsletter.objects.filter(author=user).order_by('-created_at')[:5]
+        context['my_articles'] = Article.objects.filter(author=user).only(
+            'id', 'title', 'approved'
+        ).order_by('-created_at')[:5]
+        # Only the counts are shown, so the articles aren't prefetched
+        context['my_newsletters'] = Newsletter.objects.with_article_count().filter(
+            author=user
+        ).only('id', 'title').order_by('-created_at')[:5]
     else:  # Reader
+        # Just the names the lists show
         subscriptions = user.get_subscriptions()
-        context['subscribed_publishers'] = subscriptions['publishers']
-        context['subscribed_journalists'] = subscriptions['journalists']
-        context['recent_articles'] = Article.objects.filter(approved=True).order_by('-created_at')[:5]
+        context['subscribed_publishers'] = subscriptions['publishers'].only('id', 'name')
+        context['subscribed_journalists'] = subscriptions['journalists'].only(
+            'id', 'username', 'first_name', 'last_name'
+        )
+        context['recent_articles'] = Article.objects.filter(approved=True).only(
+            'id', 'title'
+        ).order_by('-created_at')[:5]
     
     return render(request, 'news/dashboard.html', context)
 
@@ -600,8 +850,8 @@ def toggle_publisher_subscription(request, publisher_id):
     publisher = get_object_or_404(Publisher, pk=publisher_id)
     user = request.user
     
-    # Toggle subscription
-    if publisher in user.subscribed_publishers.all():
+    # Toggle subscription; check just this row rather than loading them all
+    if user.subscribed_publishers.filter(pk=publisher.pk).exists():
         user.subscribed_publishers.remove(publisher)
         messages.success(request, f"Unsubscribed from {publisher.name}")
     else:
@@ -631,13 +881,13 @@ def toggle_journalist_subscription(request, journalist_id):
     journalist = get_object_or_404(CustomUser, pk=journalist_id, role=CustomUser.JOURNALIST)
     user = request.user
     
-    # Toggle subscription
-    if journalist in user.subscribed_journalists.all():
+    # Toggle subscription; check just this row rather than loading them all
+    if user.subscribed_journalists.filter(pk=journalist.pk).exists():
         user.subscribed_journalists.remove(journalist)
-        messages.success(request, f"Unsubscribed from {journalist.get_full_name() or journalist.username}")
+        messages.success(request, f"Unsubscribed from {journalist.display_name}")
     else:
         user.subscribed_journalists.add(journalist)
-        messages.success(request, f"Subscribed to {journalist.get_full_name() or journalist.username}")
+        messages.success(request, f"Subscribed to {journalist.display_name}")
     
     # Redirect to the previous page or dashboard
     return redirect(request.META.get('HTTP_REFERER', 'dashboard'))
@@ -664,15 +914,15 @@ def browse_subscriptions(request):
     publishers = Publisher.objects.all().order_by('name')
     journalists = CustomUser.objects.filter(role=CustomUser.JOURNALIST).order_by('username')
     
-    # Get user's current subscriptions
-    subscribed_publishers = user.subscribed_publishers.all()
-    subscribed_journalists = user.subscribed_journalists.all()
+    # IDs of the user's current subscriptions (cached), as sets so the
+    # template checks each row with a hash lookup
+    subscription_ids = user.get_subscription_ids()
     
     context = {
         'publishers': publishers,
         'journalists': journalists,
-        'subscribed_publishers': subscribed_publishers,
-        'subscribed_journalists': subscribed_journalists,
+        'subscribed_publisher_ids': set(subscription_ids['publishers']),
+        'subscribed_journalist_ids': set(subscription_ids['journalists']),
     }
     
     return render(request, 'news/browse_subscriptions.html', context)
@@ -0,0 +1,22 @@
+"""
+Celery configuration for news_project project.
+
+Background tasks (such as post-approval notifications) are discovered from
+each installed app's tasks.py module.
+
+Start a worker with:
+    celery -A news_project worker -l info
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'news_project.settings')
+
+app = Celery('news_project')
+
+# Read CELERY_* options from Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+app.autodiscover_tasks()
@@ -74,6 +74,12 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'news_project.wsgi.application'
 
+# Flash messages ride in a signed cookie only. The default fallback storage
+# spills messages that overflow the cookie into the session, which would
+# make the session (and its database row) dirty on approval redirects; the
+# short one-line messages here always fit in the cookie.
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
@@ -88,6 +94,10 @@ DATABASES = {
         'PASSWORD': 'news_password',  # Change this in production
         'HOST': 'localhost',
         'PORT': '3306',
+        # Keep connections open between requests instead of reconnecting
+        # every time, and check they are still usable before reuse
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
             'charset': 'utf8mb4',
@@ -96,6 +106,17 @@ DATABASES = {
 }
 
 
+# Cache shared by every web worker, so a change that drops a cached value
+# (subscriptions, /api/users/me/, the pending article count) is seen by
+# all of them at once. Uses a different Redis database than Celery.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://localhost:6379/1',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -149,6 +170,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'news.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
 }
@@ -196,6 +221,23 @@ EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 # EMAIL_HOST_PASSWORD = 'your-app-password'
 # DEFAULT_FROM_EMAIL = 'News App <noreply@newsapp.com>'
 
+# Set to True to approve articles without emailing subscribers or posting
+# to Twitter/X (the test settings do this by default)
+NEWS_DISABLE_SIDE_EFFECTS = False
+
+# Celery Configuration (for background notification tasks)
+# For development, no broker or worker is needed: approval notifications
+# run on a thread pool in the web process, so requests don't wait on them
+CELERY_TASK_ALWAYS_EAGER = True
+
+# For production, run a broker and a worker (celery -A news_project worker):
+# CELERY_TASK_ALWAYS_EAGER = False
+CELERY_BROKER_URL = 'redis://localhost:6379/0'
+# Tasks are acknowledged when a worker starts them (Celery's default), not
+# when they finish: the email and Twitter/X tasks aren't idempotent, so a
+# task redelivered after a worker crash would notify subscribers twice
+CELERY_TASK_ACKS_LATE = False
+
 # Twitter/X API Configuration (for posting approved articles)
 # Twitter API v2 requires OAuth 1.0a authentication for posting tweets
 # You must use ALL FOUR credentials - Consumer Key/Secret AND Access Token/Secret
@@ -0,0 +1,57 @@
+"""
+Django settings for running the news_project test suite.
+
+Tests run against an in-memory SQLite database and a local-memory cache,
+so no MariaDB or Redis server is needed and nothing is written to disk.
+Behaviour specific to MariaDB (e.g. row locking in select_for_update())
+is only exercised by running the suite with the default settings.
+
+Usage:
+    python manage.py test news --settings=news_project.test_settings
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import MIDDLEWARE as BASE_MIDDLEWARE
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        # Build the test tables straight from the current models instead
+        # of replaying every migration
+        'TEST': {'MIGRATE': False},
+    }
+}
+
+# A per-process cache is enough for one test run; no Redis server needed
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Password hashing isn't under test; use the fastest hasher
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Keep sent mail in django.core.mail.outbox; never open an SMTP connection
+EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+# Approvals don't email or post unless a test opts back in with
+# override_settings(NEWS_DISABLE_SIDE_EFFECTS=False)
+NEWS_DISABLE_SIDE_EFFECTS = True
+
+# Never post to Twitter/X from a test run, even if settings.py holds
+# real credentials; tests that exercise posting override these
+TWITTER_API_KEY = ''
+TWITTER_API_SECRET = ''
+TWITTER_ACCESS_TOKEN = ''
+TWITTER_ACCESS_TOKEN_SECRET = ''
+
+# These only add response headers, which no test inspects
+MIDDLEWARE = [
+    middleware for middleware in BASE_MIDDLEWARE
+    if middleware not in (
+        'django.middleware.security.SecurityMiddleware',
+        'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    )
+]
@@ -18,11 +18,13 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+# Patterns are tried in order; the API comes first so API requests don't
+# scan the news app's pages (none of which start with api/)
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('', include('news.urls')),  # News app URLs
     path('api/', include('news.api_urls')),  # API URLs
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('admin/', admin.site.urls),
+    path('', include('news.urls')),  # News app URLs
     path('accounts/', include('django.contrib.auth.urls')),  # Login/logout URLs
 ]